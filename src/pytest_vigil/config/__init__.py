@@ -1,3 +1,3 @@
-from .settings import Settings, get_settings
+from .settings import FrozenSettings, Settings, get_settings
 
-__all__ = ["Settings", "get_settings"]
+__all__ = ["FrozenSettings", "Settings", "get_settings"]
@@ -1,3 +1,6 @@
+import os
+from dataclasses import make_dataclass
+from functools import lru_cache
 from typing import Optional, Literal
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -43,6 +46,14 @@ class Settings(BaseSettings):
         default=0.1,
         description="Interval in seconds for internal monitoring checks."
     )
+    monitor_adaptive: bool = Field(
+        default=False,
+        description="Widen the monitoring interval as a test keeps running, up to 1 second."
+    )
+    cpu_breakdown_every: int = Field(
+        default=10,
+        description="Take a per-process-type CPU sample every N monitoring checks. 0 disables the CPU breakdown."
+    )
     strict_mode: bool = Field(
         default=True,
         description="Whether to enforce strict mode for monitoring."
@@ -66,6 +77,12 @@ class Settings(BaseSettings):
         description="CPU percentage threshold below which is considered 'stalled' if exceeded stall_timeout."
     )
     
+    # Debug context
+    dump_stacks: bool = Field(
+        default=True,
+        description="Whether to log the stacks of all threads when a test is interrupted."
+    )
+    
     # Session-level timeout
     session_timeout: Optional[float] = Field(
         default=None,
@@ -76,6 +93,12 @@ class Settings(BaseSettings):
         description="Grace period in seconds after session timeout before forcefully killing the test run."
     )
     
+    # JSON report layout
+    report_format: Literal["json", "jsonl"] = Field(
+        default="json",
+        description="Layout of the --vigil-report file: 'json' (one indented document) or 'jsonl' (header line, then one line per result)."
+    )
+    
     # Report verbosity
     report_verbosity: Literal["none", "short", "full"] = Field(
         default="short",
@@ -83,6 +106,37 @@ class Settings(BaseSettings):
     )
 
 
-def get_settings() -> Settings:
-    """Retrieve application settings."""
-    return Settings()
+# Read-only snapshot of Settings handed out by get_settings(). Built from the
+# model fields so it stays in sync; attribute reads are plain slot lookups.
+FrozenSettings = make_dataclass(
+    "FrozenSettings",
+    [(name, field.annotation) for name, field in Settings.model_fields.items()],
+    frozen=True,
+    slots=True,
+)
+FrozenSettings.__module__ = __name__
+FrozenSettings.__doc__ = "Immutable snapshot of validated pytest-vigil settings."
+
+
+def _has_overrides() -> bool:
+    """Whether any environment variable or `.env` file could override the defaults."""
+    prefix = Settings.model_config["env_prefix"].upper()
+    if any(name.upper().startswith(prefix) for name in os.environ):
+        return True
+    env_file = Settings.model_config["env_file"]
+    return env_file is not None and os.path.isfile(env_file)
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> FrozenSettings:
+    """
+    Retrieve application settings.
+
+    Environment variables and the `.env` file are parsed and validated once, then
+    frozen into a `FrozenSettings` snapshot that is reused. When neither holds
+    anything for pytest-vigil the defaults are taken as-is, skipping the
+    pydantic-settings source scan. Call `get_settings.cache_clear()` to pick up
+    environment changes.
+    """
+    settings = Settings() if _has_overrides() else Settings.model_construct()
+    return FrozenSettings(**{name: getattr(settings, name) for name in Settings.model_fields})
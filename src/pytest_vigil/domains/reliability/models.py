@@ -1,9 +1,16 @@
 """Domain models for test reliability and monitoring."""
 
-from typing import List, Optional, Dict
-from datetime import datetime
+import math
+import time
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import Iterable, List, Optional, Dict, Tuple
 from enum import Enum
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, ConfigDict
+
+# Sample count below which the history is never trimmed
+MIN_TRIM_SAMPLES = 64
 
 class InteractionType(str, Enum):
     CPU = "cpu"
@@ -20,6 +27,33 @@ class ResourceLimit(BaseModel):
     
     model_config = ConfigDict(frozen=True)
 
+@dataclass(slots=True, frozen=True)
+class LimitBuckets:
+    """Resource limits partitioned by type.
+
+    The limit set is fixed for the lifetime of a test, so it is grouped once up
+    front and the monitor checks each group without comparing limit types.
+    """
+    time: Tuple[ResourceLimit, ...] = ()
+    memory: Tuple[ResourceLimit, ...] = ()
+    cpu: Tuple[ResourceLimit, ...] = ()
+    stall: Tuple[ResourceLimit, ...] = ()
+    # Shortest stall window; no stall limit can trigger before this duration
+    stall_after: float = math.inf
+
+    @classmethod
+    def from_limits(cls, limits: Iterable[ResourceLimit]) -> "LimitBuckets":
+        grouped: Dict[InteractionType, List[ResourceLimit]] = {limit_type: [] for limit_type in InteractionType}
+        for limit in limits:
+            grouped[limit.limit_type].append(limit)
+        return cls(
+            time=tuple(grouped[InteractionType.TIME]),
+            memory=tuple(grouped[InteractionType.MEMORY]),
+            cpu=tuple(grouped[InteractionType.CPU]),
+            stall=tuple(grouped[InteractionType.STALL]),
+            stall_after=min((limit.threshold for limit in grouped[InteractionType.STALL]), default=math.inf),
+        )
+
 class TestOutcome(str, Enum):
     PASSED = "passed"
     FAILED = "failed"
@@ -27,29 +61,127 @@ class TestOutcome(str, Enum):
     TIMEOUT = "timeout"
     RESOURCE_ERROR = "resource_error"
 
-class ExecutionMeasurement(BaseModel):
-    """Single point in time measurement of resources."""
-    timestamp: datetime = Field(default_factory=datetime.now)
+@dataclass(slots=True, frozen=True)
+class ExecutionMeasurement:
+    """Single point in time measurement of resources.
+
+    Created on every monitor tick, so it is a plain slotted dataclass rather
+    than a validated model. `timestamp` is a `time.monotonic()` reading.
+    """
+    timestamp: float
     cpu_percent: float
     memory_mb: float
-    cpu_breakdown: Dict[str, float] = Field(default_factory=dict)
+    # CPU per process type; samples recorded by TestExecution leave it empty,
+    # as only the peaks are kept (TestExecution.cpu_breakdown)
+    cpu_breakdown: Dict[str, float] = field(default_factory=dict)
 
-class TestExecution(BaseModel):
-    """Represents a single test execution context."""
+@dataclass(slots=True, kw_only=True)
+class TestExecution:
+    """Represents a single test execution context.
+
+    Created for every test attempt and only ever filled in by the plugin, so it
+    is a slotted dataclass rather than a validated model. Samples are stored
+    column-wise in parallel float arrays (timestamps, CPU, memory) so the
+    monitor loop appends plain floats and the policy checks scan contiguous
+    buffers instead of per-sample objects.
+
+    Only stall detection looks back over the sample history, and only over
+    its window. Samples older than `sample_window` seconds are dropped once
+    they make up at least half the history, so memory is bounded by the
+    window rather than the test's duration. With a window of 0 the columns
+    hold just the latest sample.
+    """
     item_id: str
     node_id: str
-    start_time: datetime = Field(default_factory=datetime.now)
-    measurements: List[ExecutionMeasurement] = Field(default_factory=list)
+    start_time: float = field(default_factory=time.monotonic)
     outcome: Optional[TestOutcome] = None
     retry_attempt: int = 0
+    # Seconds of sample history to keep
+    sample_window: float = math.inf
+    # Peak CPU per process type, folded in as detailed samples arrive
+    cpu_breakdown: Dict[str, float] = field(default_factory=dict)
+    # Peaks over all samples, kept up to date as samples arrive
+    max_cpu: float = field(default=0.0, init=False)
+    max_memory: float = field(default=0.0, init=False)
+
+    _timestamps: array = field(default_factory=lambda: array("d"), init=False, repr=False)
+    _cpu: array = field(default_factory=lambda: array("d"), init=False, repr=False)
+    _memory: array = field(default_factory=lambda: array("d"), init=False, repr=False)
 
     def add_measurement(self, cpu: float, memory: float, cpu_breakdown: Optional[Dict[str, float]] = None) -> None:
-        self.measurements.append(ExecutionMeasurement(
-            cpu_percent=cpu,
-            memory_mb=memory,
-            cpu_breakdown=cpu_breakdown or {}
-        ))
+        now = time.monotonic()
+        timestamps = self._timestamps
+        if self.sample_window <= 0.0 and timestamps:
+            timestamps[0] = now
+            self._cpu[0] = cpu
+            self._memory[0] = memory
+        else:
+            timestamps.append(now)
+            self._cpu.append(cpu)
+            self._memory.append(memory)
+            if len(timestamps) >= MIN_TRIM_SAMPLES and timestamps[0] < now - self.sample_window:
+                self._trim(now - self.sample_window)
+        if cpu > self.max_cpu:
+            self.max_cpu = cpu
+        if memory > self.max_memory:
+            self.max_memory = memory
+        if cpu_breakdown:
+            peaks = self.cpu_breakdown
+            for process_type, cpu_value in cpu_breakdown.items():
+                if process_type not in peaks or cpu_value > peaks[process_type]:
+                    peaks[process_type] = cpu_value
+
+    def _trim(self, keep_from: float) -> None:
+        # Trimming only once half the history has expired keeps the cost of
+        # shifting the arrays amortized to O(1) per sample
+        cut = bisect_left(self._timestamps, keep_from)
+        if cut * 2 >= len(self._timestamps):
+            del self._timestamps[:cut]
+            del self._cpu[:cut]
+            del self._memory[:cut]
+
+    @property
+    def timestamps(self) -> array:
+        """Monotonic timestamps of all samples, in recording order."""
+        return self._timestamps
+
+    @property
+    def cpu_samples(self) -> array:
+        """CPU percentage of all samples, in recording order."""
+        return self._cpu
+
+    @property
+    def memory_samples(self) -> array:
+        """Memory usage in MB of all samples, in recording order."""
+        return self._memory
+
+    @property
+    def measurements(self) -> List[ExecutionMeasurement]:
+        """Samples materialized as `ExecutionMeasurement` objects.
+
+        The list is built on every access; appending to it records nothing.
+        Assigning a list replaces the recorded samples and their peaks.
+        """
+        return [
+            ExecutionMeasurement(ts, cpu, mem)
+            for ts, cpu, mem in zip(self._timestamps, self._cpu, self._memory)
+        ]
+
+    @measurements.setter
+    def measurements(self, measurements: Iterable[ExecutionMeasurement]) -> None:
+        measurements = list(measurements)
+        self._timestamps = array("d", (m.timestamp for m in measurements))
+        self._cpu = array("d", (m.cpu_percent for m in measurements))
+        self._memory = array("d", (m.memory_mb for m in measurements))
+        self.max_cpu = max(self._cpu, default=0.0)
+        self.max_memory = max(self._memory, default=0.0)
+        peaks: Dict[str, float] = {}
+        for m in measurements:
+            for process_type, cpu_value in m.cpu_breakdown.items():
+                if process_type not in peaks or cpu_value > peaks[process_type]:
+                    peaks[process_type] = cpu_value
+        self.cpu_breakdown = peaks
 
     @property
     def duration(self) -> float:
-        return (datetime.now() - self.start_time).total_seconds()
+        return time.monotonic() - self.start_time
@@ -1,58 +1,66 @@
 """Domain services for reliability logic."""
 
-from typing import List, Optional
-from loguru import logger
-from pytest_vigil.domains.reliability.models import TestExecution, ResourceLimit, InteractionType
+import time
+from bisect import bisect_left
+from typing import Optional
+from pytest_vigil.domains.reliability.models import TestExecution, ResourceLimit, LimitBuckets
 
 class PolicyService:
     """Service to evaluate test execution against reliability policies."""
 
-    def check_violation(self, execution: TestExecution, limits: List[ResourceLimit]) -> Optional[ResourceLimit]:
-        """Checks if the current execution violates any resource limits."""
+    def check_violation(self, execution: TestExecution, limits: LimitBuckets) -> Optional[ResourceLimit]:
+        """
+        Checks if the current execution violates any resource limits.
+
+        Groups are checked cheapest first: time (one comparison), memory and CPU
+        (latest sample), then stall (scans the sample window), which is skipped
+        entirely until the test has run for the shortest stall window.
+        """
         duration = execution.duration
-        
+        for limit in limits.time:
+            if duration > limit.threshold:
+                return limit
+
         # Get latest measurement if available
+        cpu_samples = execution.cpu_samples
         cpu = 0.0
         memory = 0.0
-        if execution.measurements:
-            latest = execution.measurements[-1]
-            cpu = latest.cpu_percent
-            memory = latest.memory_mb
-
-        for limit in limits:
-            if limit.limit_type == InteractionType.TIME:
-                if duration > limit.threshold:
-                    return limit
-            elif limit.limit_type == InteractionType.MEMORY:
-                if memory > limit.threshold:
-                    return limit
-            elif limit.limit_type == InteractionType.CPU:
-                if cpu > limit.threshold:
+        if cpu_samples:
+            cpu = cpu_samples[-1]
+            memory = execution.memory_samples[-1]
+
+        for limit in limits.memory:
+            if memory > limit.threshold:
+                return limit
+
+        for limit in limits.cpu:
+            if cpu > limit.threshold:
+                return limit
+
+        if duration >= limits.stall_after:
+            for limit in limits.stall:
+                if self._is_stalled(limit, execution, duration):
                     return limit
-            elif limit.limit_type == InteractionType.STALL:
-                # Stall detection: Check if CPU has been consistently low for at least `limit.threshold` seconds
-                # threshold = stall_timeout (time window, e.g., 0.5s)
-                # secondary_threshold = stall_cpu_threshold (CPU percentage, e.g., 1.0%)
-                if limit.secondary_threshold is not None and execution.measurements and duration >= limit.threshold:
-                    # Only check after test has been running for at least stall_timeout
-                    # Get current time
-                    from datetime import datetime, timedelta
-                    now = datetime.now()
-                    stall_window_start = now - timedelta(seconds=limit.threshold)
-                    
-                    # Find measurements within the stall time window (last `stall_timeout` seconds)
-                    window_measurements = [
-                        m for m in execution.measurements 
-                        if m.timestamp >= stall_window_start
-                    ]
-                    
-                    # Check if all measurements in window show low CPU
-                    if window_measurements:
-                        all_below_threshold = all(
-                            m.cpu_percent <= limit.secondary_threshold 
-                            for m in window_measurements
-                        )
-                        if all_below_threshold:
-                            return limit
 
         return None
+
+    @staticmethod
+    def _is_stalled(limit: ResourceLimit, execution: TestExecution, duration: float) -> bool:
+        # Stall detection: Check if CPU has been consistently low for at least `limit.threshold` seconds
+        # threshold = stall_timeout (time window, e.g., 0.5s)
+        # secondary_threshold = stall_cpu_threshold (CPU percentage, e.g., 1.0%)
+        cpu_samples = execution.cpu_samples
+        if limit.secondary_threshold is None or not cpu_samples or duration < limit.threshold:
+            # Only check after test has been running for at least stall_timeout
+            return False
+
+        # Measurement timestamps are monotonic seconds
+        stall_window_start = time.monotonic() - limit.threshold
+
+        # Timestamps are appended in order, so binary search finds the start
+        # of the stall time window (last `stall_timeout` seconds)
+        start = bisect_left(execution.timestamps, stall_window_start)
+
+        # Check if all measurements in window show low CPU
+        window_cpu = cpu_samples[start:]
+        return bool(window_cpu) and max(window_cpu) <= limit.secondary_threshold
@@ -1,34 +1,64 @@
 """Interruption logic for stopping tests."""
 
+import faulthandler
 import os
 import signal
 import _thread
 import sys
+import tempfile
 from loguru import logger
+from pytest_vigil.infrastructure.enforcement.signals import handler_installed
+
+# Innermost frames kept per thread by the fallback stack formatter
+STACK_DUMP_DEPTH = 20
 
 class Interrupter:
     """Handles the mechanism of interrupting a running test."""
 
+    def __init__(self, dump_stacks: bool = True):
+        self.dump_stacks = dump_stacks
+
     def trigger(self, reason: str) -> None:
         """Triggers the interruption."""
         logger.error(f"Test interruption triggered: {reason}")
-        self._dump_stacks()
+        if self.dump_stacks:
+            self._dump_stacks()
         
         if hasattr(signal, "SIGALRM"):
              # Send SIGALRM to self. 
              # The handler (registered in setup) should raise the exception.
-             os.kill(os.getpid(), signal.SIGALRM)
+             # Without it, e.g. in a session run off the main thread, the
+             # default action would kill the process instead.
+             if handler_installed():
+                 os.kill(os.getpid(), signal.SIGALRM)
+             else:
+                 logger.warning("Vigil timeout handler is not installed; test not interrupted")
         else:
              # Fallback
              _thread.interrupt_main()
 
     def _dump_stacks(self) -> None:
+        # faulthandler walks and prints every thread's stack in C without reading
+        # source files. It needs a real file descriptor, hence the temp file.
+        try:
+            with tempfile.TemporaryFile() as f:
+                faulthandler.dump_traceback(file=f, all_threads=True)
+                f.seek(0)
+                dump = f.read().decode("utf-8", errors="replace")
+        except (OSError, RuntimeError, ValueError):
+            dump = self._format_stacks()
+        logger.error(f"\n{dump}")
+
+    def _format_stacks(self) -> str:
         import traceback
         code = []
         for threadId, stack in sys._current_frames().items():
             code.append(f"\n# Thread: {threadId}")
-            for filename, lineno, name, line in traceback.extract_stack(stack):
-                code.append(f'File: "{filename}", line {lineno}, in {name}')
-                if line:
-                    code.append(f"  {line}")
-        logger.error("\n".join(code))
+            # Skip source line lookup: it reads every file in the stack from disk
+            # while the test is waiting to be interrupted.
+            frames = traceback.StackSummary.extract(
+                traceback.walk_stack(stack), limit=STACK_DUMP_DEPTH, lookup_lines=False
+            )
+            for frame in reversed(frames):
+                code.append(f'File: "{frame.filename}", line {frame.lineno}, in {frame.name}')
+        return "\n".join(code)
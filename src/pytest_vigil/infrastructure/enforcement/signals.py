@@ -1,25 +1,86 @@
 """Signal handling infrastructure."""
 
 import signal
-from typing import Any, Optional
+import threading
+from typing import Any, List, Optional, Tuple
 
 class TimeoutException(BaseException):
     """Exception raised when a test times out."""
     pass
 
+# The SIGALRM handler stays installed across tests; `_armed` decides whether a
+# delivered signal interrupts the running test. Swapping the handler with
+# signal.signal() around every test is avoided.
+_armed = False
+_previous_handler: Optional[Any] = None
+# (_armed, _previous_handler) saved by each install() still in effect, innermost
+# last. A pytest run inside a test (e.g. pytester's in-process runs) installs
+# again, and its uninstall() must hand the enclosing test back its state.
+_enclosing: List[Tuple[bool, Optional[Any]]] = []
+
 def timeout_signal_handler(signum: int, frame: Any) -> None:
-    """Signal handler that raises TimeoutException."""
-    raise TimeoutException("Test timed out (Vigil)")
+    """Signal handler that raises TimeoutException while a test is monitored."""
+    if _armed:
+        raise TimeoutException("Test timed out (Vigil)")
+    # Not ours: hand the signal to whatever handled it before vigil
+    if callable(_previous_handler):
+        _previous_handler(signum, frame)
 
-class SignalManager:
-    def __init__(self):
-        self._old_handler: Optional[Any] = None
+def _can_install() -> bool:
+    # signal.signal() only works on the main thread, e.g. not for pytest.main()
+    # called from a worker thread
+    return hasattr(signal, "SIGALRM") and threading.current_thread() is threading.main_thread()
+
+def _ensure_installed() -> None:
+    global _previous_handler
+    if _can_install():
+        if signal.getsignal(signal.SIGALRM) is not timeout_signal_handler:
+            _previous_handler = signal.signal(signal.SIGALRM, timeout_signal_handler)
 
+def handler_installed() -> bool:
+    """Whether a SIGALRM delivered now reaches the timeout handler."""
+    return hasattr(signal, "SIGALRM") and signal.getsignal(signal.SIGALRM) is timeout_signal_handler
+
+class SignalManager:
     def install(self) -> None:
-        if hasattr(signal, "SIGALRM"):
-            self._old_handler = signal.signal(signal.SIGALRM, timeout_signal_handler)
+        """
+        Installs the timeout handler if it is not in place yet.
+
+        Calls nest: each must be matched by uninstall(), which restores the
+        state saved here. The armed state is kept, so a test running a nested
+        session can still be interrupted while that session runs.
+        """
+        _enclosing.append((_armed, _previous_handler))
+        _ensure_installed()
+
+    def arm(self) -> None:
+        """
+        Arms the timeout handler, reinstalling it if something replaced it.
+
+        Where it cannot be installed, tests are not interrupted.
+        """
+        global _armed
+        _ensure_installed()
+        _armed = handler_installed()
 
     def restore(self) -> None:
-        if hasattr(signal, "SIGALRM") and self._old_handler is not None:
-            signal.signal(signal.SIGALRM, self._old_handler)
-            self._old_handler = None
+        """Disarms the timeout handler, back to the state of the enclosing install()."""
+        global _armed
+        _armed = _enclosing[-1][0] if _enclosing else False
+
+    def uninstall(self) -> None:
+        """
+        Undoes the matching install(). The outermost one puts back the handler
+        that was active before vigil; nested ones restore the enclosing state.
+        """
+        global _armed, _previous_handler
+        outer = _enclosing.pop() if _enclosing else (False, None)
+        if _enclosing:
+            _armed, _previous_handler = outer
+            _ensure_installed()
+            return
+        _armed = False
+        if _can_install() and handler_installed():
+            previous = _previous_handler if _previous_handler is not None else signal.SIG_DFL
+            signal.signal(signal.SIGALRM, previous)
+        _previous_handler = None
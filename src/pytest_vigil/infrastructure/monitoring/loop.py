@@ -1,75 +1,242 @@
 """Monitoring loop infrastructure."""
 
+import os
 import threading
 import time
-from typing import List, Callable, Optional
+from typing import Dict, List, Callable, Optional, Sequence, Set, Tuple
 from loguru import logger
-from pytest_vigil.domains.reliability.models import TestExecution, ResourceLimit
+from pytest_vigil.domains.reliability.models import TestExecution, ResourceLimit, LimitBuckets
 from pytest_vigil.domains.reliability.services import PolicyService
-from pytest_vigil.infrastructure.monitoring.system import SystemMonitor
+from pytest_vigil.infrastructure.monitoring.system import SystemMonitor, get_system_monitor
+
+# Sample tuple handed to monitors: (cpu_percent, memory_mb, cpu_breakdown or None)
+Sample = Tuple[float, float, Optional[Dict[str, float]]]
+
+# Adaptive sampling: after this many seconds, wait this fraction of the elapsed time
+ADAPTIVE_AFTER = 1.0
+ADAPTIVE_FRACTION = 0.05
+
+# Delay before the first sample is checked, so that a limit exceeded from the
+# start interrupts the test itself rather than pytest setting it up
+FIRST_CHECK_DELAY = 0.005
+
+# Seconds the scheduler thread waits without monitors before it exits
+IDLE_EXIT_AFTER = 1.0
 
 class VigilMonitor:
-    """Manages the background monitoring thread for a test execution."""
+    """Monitors a test execution against its resource limits."""
 
     def __init__(
-        self, 
-        execution: TestExecution, 
-        limits: List[ResourceLimit],
+        self,
+        execution: TestExecution,
+        limits: Sequence[ResourceLimit],
         policy_service: PolicyService,
         on_violation: Callable[[ResourceLimit], None],
-        interval: float = 0.1
+        interval: float = 0.1,
+        max_interval: float = 1.0,
+        detailed_every: int = 10,
+        system_monitor: Optional[SystemMonitor] = None,
+        adaptive: bool = False,
+        backoff: bool = True
     ):
         self.execution = execution
         self.limits = limits
+        self._limit_buckets = LimitBuckets.from_limits(limits)
         self.policy_service = policy_service
         self.on_violation = on_violation
         self.interval = interval
+        self.max_interval = max_interval
+        self.detailed_every = detailed_every
+        self.adaptive = adaptive
+        self.backoff = backoff
         self._stop_event = threading.Event()
-        self._monitor = SystemMonitor()
-        self._thread: Optional[threading.Thread] = None
+        self._monitor = system_monitor or get_system_monitor()
+        self._iteration = 0
 
     def start(self) -> None:
-        """Starts the monitoring thread."""
-        self._thread = threading.Thread(
-            target=self._run, 
-            daemon=True, 
-            name=f"vigil-monitor-{self.execution.item_id}"
-        )
-        self._thread.start()
+        """Starts monitoring on the shared scheduler thread."""
+        get_scheduler().register(self)
 
     def stop(self) -> None:
-        """Stops the monitoring thread."""
+        """Stops monitoring; no violation is reported once this returns."""
+        # Flag first so the scheduler drops this monitor even if unregistering is interrupted
         self._stop_event.set()
-        if self._thread and self._thread.is_alive():
-            self._thread.join(timeout=1.0)
+        get_scheduler().unregister(self)
+
+    @property
+    def _wants_detailed(self) -> bool:
+        # Collect detailed stats every `detailed_every` iterations to reduce overhead
+        return self.detailed_every > 0 and self._iteration % self.detailed_every == 0
+
+    def _tick(self, sample: Sample) -> bool:
+        """
+        Records one sample and checks it against the limits.
+
+        Returns False once monitoring should end (a strict limit was violated).
+        """
+        self._record(sample)
+        return self._check()
+
+    def _record(self, sample: Sample) -> None:
+        cpu, mem, cpu_breakdown = sample
+        # For other iterations there is no breakdown to record
+        self.execution.add_measurement(cpu, mem, cpu_breakdown if self._wants_detailed else None)
+        self._iteration += 1
+
+    def _check(self) -> bool:
+        """Checks the execution against the limits; False once a strict one is violated."""
+        violation = self.policy_service.check_violation(self.execution, self._limit_buckets)
+        if violation:
+            # Callback
+            self.on_violation(violation)
+            if violation.strict:
+                return False
+        return True
+
+    def _next_interval(self) -> float:
+        """
+        Returns how long to wait before the next sample.
+
+        CPU, memory and stall limits are judged on every sample, so they keep the
+        base interval. When only time limits apply, the wait is half the time left
+        to the nearest deadline, clamped to [interval, max_interval]: sparse while
+        the deadline is far away, back to the base interval as it approaches.
+        Without backoff, e.g. when the samples feed a report, they keep the base
+        interval too.
+
+        In adaptive mode, the other limits are sampled less often as the test
+        keeps running: past ADAPTIVE_AFTER seconds the wait grows with the
+        elapsed time, up to max_interval, and to at most half the shortest
+        stall window so a stall still spans several samples.
+        """
+        buckets = self._limit_buckets
+        if not self.backoff or not buckets.time or buckets.memory or buckets.cpu or buckets.stall:
+            if not self.adaptive:
+                return self.interval
+            elapsed = self.execution.duration
+            if elapsed <= ADAPTIVE_AFTER:
+                return self.interval
+            widened = min(elapsed * ADAPTIVE_FRACTION, self.max_interval, buckets.stall_after * 0.5)
+            return max(self.interval, widened)
+        slack = min(limit.threshold for limit in buckets.time) - self.execution.duration
+        return max(self.interval, min(slack * 0.5, self.max_interval))
+
+
+class MonitorScheduler:
+    """
+    Runs every active VigilMonitor on one background thread.
+
+    Monitors due at the same wake-up share a single reading per SystemMonitor,
+    so concurrent executions cost one thread and one set of psutil calls
+    instead of one each.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        # Active monitors mapped to their next due time (monotonic)
+        self._due: Dict[VigilMonitor, float] = {}
+        self._thread: Optional[threading.Thread] = None
+        # Monitors whose registration sample is recorded but not yet checked
+        self._unchecked: Set[VigilMonitor] = set()
+
+    def register(self, monitor: VigilMonitor) -> None:
+        with self._cond:
+            # Take the first sample right away so even instant tests are measured.
+            # The system monitor is shared between tests, so unless other tests are
+            # being monitored, this also resets the CPU baseline to this test.
+            fresh = not any(other._monitor is monitor._monitor for other in self._due)
+            sample = self._sample(monitor._monitor, monitor._wants_detailed, fresh)
+            # It is checked on the scheduler thread, as an interrupt raised on
+            # this thread would escape the test, after FIRST_CHECK_DELAY.
+            if sample is not None:
+                monitor._record(sample)
+                self._unchecked.add(monitor)
+                self._due[monitor] = time.monotonic() + min(FIRST_CHECK_DELAY, monitor.interval)
+            else:
+                self._due[monitor] = time.monotonic() + monitor.interval
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, daemon=True, name="vigil-monitor")
+                self._thread.start()
+            self._cond.notify()
+
+    def unregister(self, monitor: VigilMonitor) -> None:
+        # Taking the lock waits out a tick in progress, like joining a thread would
+        with self._cond:
+            self._due.pop(monitor, None)
+            self._unchecked.discard(monitor)
 
     def _run(self) -> None:
-        # Initialize CPU counter (first call often irrelevant)
-        self._monitor.get_stats()
-        
-        iteration = 0
-        while not self._stop_event.is_set():
+        with self._cond:
+            while True:
+                if not self._due:
+                    if not self._cond.wait(IDLE_EXIT_AFTER) and not self._due:
+                        # register() starts a new thread when it is needed again. An idle
+                        # thread never outlives its scheduler, e.g. a module reloaded by
+                        # an in-process pytest run.
+                        self._thread = None
+                        return
+                    continue
+                now = time.monotonic()
+                next_due = min(self._due.values())
+                if next_due > now:
+                    self._cond.wait(next_due - now)
+                    continue
+                self._tick([m for m, at in self._due.items() if at <= now and not m._stop_event.is_set()])
+                # Drop monitors stopped without reaching unregister()
+                for monitor in [m for m in self._due if m._stop_event.is_set()]:
+                    del self._due[monitor]
+                    self._unchecked.discard(monitor)
+
+    def _tick(self, due: List[VigilMonitor]) -> None:
+        samples: Dict[SystemMonitor, Optional[Sample]] = {}
+        for monitor in due:
             try:
-                # Collect detailed stats every 10 iterations to reduce overhead
-# For other iterations, use simple stats
-                if iteration % 10 == 0:
-                    cpu, mem, cpu_breakdown = self._monitor.get_detailed_stats()
-                    self.execution.add_measurement(cpu, mem, cpu_breakdown)
+                if monitor in self._unchecked:
+                    # The sample taken at registration is checked like any other
+                    self._unchecked.discard(monitor)
+                    keep = monitor._check()
                 else:
-                    cpu, mem = self._monitor.get_stats()
-                    self.execution.add_measurement(cpu, mem, {})
-                
-                iteration += 1
-                
-                violation = self.policy_service.check_violation(self.execution, self.limits)
-                if violation:
-                    # Callback
-                    self.on_violation(violation)
-                    if violation.strict:
-                        break
+                    system_monitor = monitor._monitor
+                    if system_monitor not in samples:
+                        samples[system_monitor] = self._sample(
+                            system_monitor, any(m._wants_detailed for m in due if m._monitor is system_monitor)
+                        )
+                    sample = samples[system_monitor]
+                    keep = sample is not None and monitor._tick(sample)
             except Exception as e:
                 # Reliability: Plugin crash shouldn't affect suite
                 logger.error(f"Vigil monitor error: {e}")
-                break
-            
-            time.sleep(self.interval)
+                keep = False
+            if keep:
+                self._due[monitor] = time.monotonic() + monitor._next_interval()
+            else:
+                del self._due[monitor]
+
+    @staticmethod
+    def _sample(system_monitor: SystemMonitor, detailed: bool, fresh: bool = False) -> Optional[Sample]:
+        try:
+            if fresh:
+                return system_monitor.reset()
+            if detailed:
+                return system_monitor.get_detailed_stats()
+            cpu, mem = system_monitor.get_stats()
+            return cpu, mem, None
+        except Exception as e:
+            logger.error(f"Vigil monitor error: {e}")
+            return None
+
+
+_scheduler: Optional[MonitorScheduler] = None
+_scheduler_pid: Optional[int] = None
+
+def get_scheduler() -> MonitorScheduler:
+    """
+    Returns the process-wide MonitorScheduler, creating it on first use.
+
+    Threads do not survive a fork, so a fresh scheduler is created in the child.
+    """
+    global _scheduler, _scheduler_pid
+    if _scheduler is None or _scheduler_pid != os.getpid():
+        _scheduler = MonitorScheduler()
+        _scheduler_pid = os.getpid()
+    return _scheduler
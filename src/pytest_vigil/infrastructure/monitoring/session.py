@@ -42,14 +42,14 @@ class SessionMonitor:
 
     def start(self) -> None:
         """Start the session monitoring thread."""
-        self._start_time = time.time()
+        self._start_time = time.monotonic()
         self._thread = threading.Thread(
             target=self._run,
             daemon=True,
             name="vigil-session-monitor"
         )
         self._thread.start()
-        logger.info(f"Session monitor started with timeout of {self.timeout}s")
+        logger.info("Session monitor started with timeout of {}s", self.timeout)
 
     def stop(self) -> None:
         """Stop the session monitoring thread."""
@@ -59,22 +59,18 @@ class SessionMonitor:
         logger.debug("Session monitor stopped")
 
     def _run(self) -> None:
-        """Main monitoring loop."""
+        """Wait for the session deadline and handle the timeout if it passes.
+
+        `stop()` sets the event, which ends the wait early, so there is no need
+        to poll in between.
+        """
         if self._start_time is None:
             logger.error("Session monitor started without start_time")
             return
-            
-        while not self._stop_event.is_set():
-            elapsed = time.time() - self._start_time
-            remaining = self.timeout - elapsed
-
-            if remaining <= 0:
-                self._handle_timeout()
-                break
 
-            # Check every second or at the remaining time, whichever is shorter
-            sleep_time = min(1.0, remaining)
-            self._stop_event.wait(sleep_time)
+        remaining = self.timeout - (time.monotonic() - self._start_time)
+        if not self._stop_event.wait(max(remaining, 0.0)):
+            self._handle_timeout()
 
     def _handle_timeout(self) -> None:
         """Handle session timeout by terminating child processes and exiting."""
@@ -148,28 +144,32 @@ class SessionMonitor:
             children = current_process.children(recursive=True)
             
             if children:
-                logger.info(f"Terminating {len(children)} child process(es)...")
+                logger.info("Terminating {} child process(es)...", len(children))
                 for child in children:
                     try:
-                        logger.debug(f"Terminating child process {child.pid}: {child.name()}")
+                        # name() is only read if the record is emitted
+                        logger.opt(lazy=True).debug(
+                            "Terminating child process {}: {}", lambda: child.pid, lambda: child.name()
+                        )
                         child.terminate()
                     except psutil.NoSuchProcess:
                         pass
                     except Exception as e:
                         logger.warning(f"Error terminating child process {child.pid}: {e}")
                 
-                # Give children time to terminate gracefully
-                gone, alive = psutil.wait_procs(children, timeout=3)
+                # Give children the configured grace period to terminate;
+                # wait_procs returns as soon as all of them are gone
+                gone, alive = psutil.wait_procs(children, timeout=self.grace_period)
                 
                 if gone:
-                    logger.debug(f"Successfully terminated {len(gone)} child process(es)")
+                    logger.debug("Successfully terminated {} child process(es)", len(gone))
                 
                 # Force kill any remaining children
                 if alive:
                     logger.warning(f"Force killing {len(alive)} remaining child process(es)")
                     for child in alive:
                         try:
-                            logger.debug(f"Force killing child process {child.pid}")
+                            logger.debug("Force killing child process {}", child.pid)
                             child.kill()
                         except psutil.NoSuchProcess:
                             pass
@@ -1,13 +1,97 @@
 """System monitoring infrastructure using psutil."""
 
 import os
+import re
+import sys
+import time
 import psutil
-from typing import Tuple, Dict
+from collections import defaultdict
+from functools import lru_cache
+from typing import Tuple, Dict, Optional
 from loguru import logger
 
+# Detailed samples between re-scans of the child process tree
+CHILD_REFRESH_INTERVAL = 5
+
+# Minimum seconds between psutil reads; callers within it get the last result.
+# cpu_percent() over a shorter span is mostly noise.
+MIN_SAMPLE_INTERVAL = 0.05
+
+# get_stats() reads RSS on every Nth call and reports the last reading in
+# between. RSS moves slowly compared to CPU, which needs every sample.
+MEMORY_SAMPLE_EVERY = 2
+
+# Size of a memory page in MB, to convert /proc/<pid>/statm page counts
+_PAGE_MB = os.sysconf("SC_PAGE_SIZE") / (1024 * 1024) if hasattr(os, "sysconf") else 0.0
+
+# Process categorization keywords, each group matched in one regex scan
+_BROWSER_RE = re.compile("chrome|chromium|firefox|safari|edge")
+_WEBDRIVER_RE = re.compile("geckodriver|chromedriver|safaridriver")
+_AUTOMATION_RE = re.compile("playwright|puppeteer")
+# Chromium sub-process types, checked in priority order
+_BROWSER_SUBTYPES = (
+    (re.compile("gpu-process"), "gpu"),
+    (re.compile("renderer"), "renderer"),
+    (re.compile("network|--type=utility"), "network"),
+)
+
 class SystemMonitor:
     def __init__(self):
         self._process = psutil.Process(os.getpid())
+        # Known children by pid: (process, category, cpu seconds at last sample).
+        # The category is filled in the first time the child shows CPU usage;
+        # psutil.Process equality compares create_time too, so a reused pid is
+        # detected on refresh.
+        self._children: Dict[int, Tuple[psutil.Process, Optional[str], Optional[float]]] = {}
+        self._children_age = CHILD_REFRESH_INTERVAL
+        self._children_sampled_at = time.monotonic()
+        # Last results with their monotonic timestamps, see MIN_SAMPLE_INTERVAL
+        self._last_stats: Optional[Tuple[float, float]] = None
+        self._last_stats_at = 0.0
+        self._last_detailed: Optional[Tuple[float, float, Dict[str, float]]] = None
+        self._last_detailed_at = 0.0
+        # Last RSS reading and get_stats() calls since, see MEMORY_SAMPLE_EVERY
+        self._memory_mb: Optional[float] = None
+        self._memory_age = 0
+        # On Linux RSS is read straight from /proc/<pid>/statm through a descriptor
+        # kept open for the monitor's lifetime; elsewhere psutil is used.
+        self._statm_fd: Optional[int] = None
+        if sys.platform.startswith("linux") and _PAGE_MB:
+            try:
+                self._statm_fd = os.open(f"/proc/{self._process.pid}/statm", os.O_RDONLY)
+            except OSError:
+                pass
+
+    def __del__(self):
+        statm_fd = getattr(self, "_statm_fd", None)
+        if statm_fd is not None:
+            os.close(statm_fd)
+
+    @property
+    def pid(self) -> int:
+        """PID of the monitored process."""
+        return self._process.pid
+
+    def reset(self) -> Tuple[float, float, Dict[str, float]]:
+        """
+        Starts measuring afresh, e.g. for a new test, and returns the first sample.
+
+        Cached readings (see MIN_SAMPLE_INTERVAL) are dropped and the CPU
+        baselines of the process and its children are moved to now. CPU usage
+        is measured from here on, so the sample has none yet, only memory.
+        
+        Returns:
+            Tuple[float, float, Dict[str, float]]: like get_detailed_stats()
+        """
+        self._last_stats = None
+        self._last_detailed = None
+        _, self._memory_mb = self._cpu_and_rss_mb()
+        self._memory_age = 0
+        self._children = {
+            pid: (child, process_type, None) for pid, (child, process_type, _) in self._children.items()
+        }
+        self._children_sampled_at = time.monotonic()
+        return 0.0, self._memory_mb, {"pytest": 0.0}
 
     def get_stats(self) -> Tuple[float, float]:
         """
@@ -16,16 +100,40 @@ class SystemMonitor:
         Returns:
             Tuple[float, float]: (cpu_percent, memory_mb)
         """
-        # cpu_percent(interval=None) is non-blocking and compares to last call
-        # First call returns 0.0 usually, subsequent calls return avg since last call.
-        cpu = self._process.cpu_percent(interval=None)
+        now = time.monotonic()
+        if self._last_stats is not None and now - self._last_stats_at < MIN_SAMPLE_INTERVAL:
+            return self._last_stats
+
+        self._memory_age += 1
+        if self._memory_mb is None or self._memory_age >= MEMORY_SAMPLE_EVERY:
+            cpu, self._memory_mb = self._cpu_and_rss_mb()
+            self._memory_age = 0
+        else:
+            # cpu_percent(interval=None) is non-blocking and compares to last call
+            # First call returns 0.0 usually, subsequent calls return avg since last call.
+            cpu = self._process.cpu_percent(interval=None)
         
-        mem_info = self._process.memory_info()
+        self._last_stats = (cpu, self._memory_mb)
+        self._last_stats_at = now
+        return self._last_stats
+
+    def _cpu_and_rss_mb(self) -> Tuple[float, float]:
+        if self._statm_fd is None:
+            # RSS comes from psutil, so let one oneshot() snapshot serve both reads
+            with self._process.oneshot():
+                return self._process.cpu_percent(interval=None), self._rss_mb()
+        return self._process.cpu_percent(interval=None), self._rss_mb()
+
+    def _rss_mb(self) -> float:
         # RSS is generic "Resident Set Size", good proxy for "how much memory this test added" 
         # in a naive way, though garbage collection complicates it.
-        mem_mb = mem_info.rss / (1024 * 1024)
-        
-        return cpu, mem_mb
+        if self._statm_fd is not None:
+            try:
+                # statm fields are page counts: size, resident, shared, ...
+                return int(os.pread(self._statm_fd, 128, 0).split()[1]) * _PAGE_MB
+            except (OSError, IndexError, ValueError):
+                pass
+        return self._process.memory_info().rss / (1024 * 1024)
 
     def get_detailed_stats(self) -> Tuple[float, float, Dict[str, float]]:
         """
@@ -35,10 +143,16 @@ class SystemMonitor:
             Tuple[float, float, Dict[str, float]]: (total_cpu_percent, memory_mb, cpu_breakdown)
             cpu_breakdown is a dict mapping process type to CPU percentage
         """
+        now = time.monotonic()
+        if self._last_detailed is not None and now - self._last_detailed_at < MIN_SAMPLE_INTERVAL:
+            total_cpu, mem_mb, cpu_breakdown = self._last_detailed
+            # Callers may keep the breakdown, so each gets its own dict
+            return total_cpu, mem_mb, dict(cpu_breakdown)
+
         # Get main process stats first
-        main_cpu = self._process.cpu_percent(interval=None)
-        mem_info = self._process.memory_info()
-        mem_mb = mem_info.rss / (1024 * 1024)
+        main_cpu, mem_mb = self._cpu_and_rss_mb()
+        self._memory_mb = mem_mb
+        self._memory_age = 0
         
         # Initialize breakdown with main process
         cpu_breakdown = {"pytest": main_cpu}
@@ -46,33 +160,70 @@ class SystemMonitor:
         
         try:
             # Only check for children if we have any
-            # Use non-recursive check first for performance
-            num_children = self._process.num_threads()  # Quick check
-            if num_children > 1:  # More than just the main thread
-                # Get all child processes
-                children = self._process.children(recursive=True)
-                
-                # Categorize and sum CPU by process type
-                for child in children:
+            children = self._get_children()
+            if children:
+                # Child CPU is the change in its CPU time over one shared wall-clock
+                # interval, instead of a cpu_percent() call keeping its own timer
+                elapsed = now - self._children_sampled_at
+                self._children_sampled_at = now
+
+                # Categorize and sum CPU by process type; category names never
+                # clash with the "pytest" entry, so the sums are merged in at the end
+                child_cpu_by_type: Dict[str, float] = defaultdict(float)
+                for pid, (child, process_type, last_cpu_time) in list(children.items()):
                     try:
-                        child_cpu = child.cpu_percent(interval=None)
-                        if child_cpu > 0.0:  #Only count processes with actual CPU usage
-                            total_cpu += child_cpu
-                            
-                            # Categorize process by name
-                            process_type = self._categorize_process(child)
-                            cpu_breakdown[process_type] = cpu_breakdown.get(process_type, 0.0) + child_cpu
-                        
+                        with child.oneshot():
+                            cpu_times = child.cpu_times()
+                            cpu_time = cpu_times.user + cpu_times.system
+                            if last_cpu_time is not None and cpu_time > last_cpu_time and elapsed > 0.0:
+                                #Only count processes with actual CPU usage
+                                # Categorize process by name, once per child
+                                if process_type is None:
+                                    process_type = self._categorize_process(child)
+                                child_cpu_by_type[process_type] += round((cpu_time - last_cpu_time) / elapsed * 100.0, 1)
+                        self._children[pid] = (child, process_type, cpu_time)
+
                     except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
                         # Process may have terminated or is not accessible
+                        self._children.pop(pid, None)
                         continue
+
+                cpu_breakdown.update(child_cpu_by_type)
+                total_cpu += sum(child_cpu_by_type.values())
             
         except Exception as e:
-            logger.debug(f"Error collecting child process stats: {e}")
+            # Arguments are only formatted if a handler takes DEBUG records
+            logger.debug("Error collecting child process stats: {}", e)
             # Continue with main process stats only
         
-        return total_cpu, mem_mb, cpu_breakdown
+        self._last_detailed = (total_cpu, mem_mb, cpu_breakdown)
+        self._last_detailed_at = now
+        return total_cpu, mem_mb, dict(cpu_breakdown)
     
+    def _get_children(self) -> Dict[int, Tuple[psutil.Process, Optional[str], Optional[float]]]:
+        """
+        Returns the cached child processes, re-scanning the process tree every
+        CHILD_REFRESH_INTERVAL calls.
+
+        New children start without a CPU time baseline, so they report CPU usage
+        from the sample after they are first seen.
+        """
+        self._children_age += 1
+        if self._children_age >= CHILD_REFRESH_INTERVAL:
+            self._children_age = 0
+            # Use non-recursive check first for performance: most tests start no
+            # processes, and a thread count says nothing about child processes
+            if not self._process.children(recursive=False):
+                self._children = {}
+                return self._children
+            known = self._children
+            refreshed = {}
+            for child in self._process.children(recursive=True):
+                cached = known.get(child.pid)
+                refreshed[child.pid] = cached if cached is not None and cached[0] == child else (child, None, None)
+            self._children = refreshed
+        return self._children
+
     def _categorize_process(self, process: psutil.Process) -> str:
         """
         Categorize a process by its name/command line.
@@ -80,35 +231,53 @@ class SystemMonitor:
         Returns process type: browser, gpu, network, renderer, python, or other
         """
         try:
-            name = process.name().lower()
-            cmdline = " ".join(process.cmdline()).lower()
-            
-            # Browser processes
-            if any(browser in name for browser in ["chrome", "chromium", "firefox", "safari", "edge"]):
-                # More specific categorization for Chromium-based browsers
-                if "gpu-process" in cmdline or "--type=gpu-process" in cmdline:
-                    return "gpu"
-                elif "renderer" in cmdline or "--type=renderer" in cmdline:
-                    return "renderer"
-                elif "network" in cmdline or "--type=utility" in cmdline:
-                    return "network"
-                else:
-                    return "browser"
-            
-            # WebDriver/Selenium
-            if any(driver in name for driver in ["geckodriver", "chromedriver", "safaridriver"]):
-                return "webdriver"
-            
-            # Python subprocesses
-            if "python" in name:
-                return "python"
-            
-            # Playwright/Puppeteer
-            if "playwright" in cmdline or "puppeteer" in cmdline:
-                return "automation"
-            
-            # Default
-            return "other"
-            
+            return _categorize(process.name().lower(), " ".join(process.cmdline()).lower())
         except (psutil.NoSuchProcess, psutil.AccessDenied):
             return "other"
+
+
+@lru_cache(maxsize=4096)
+def _categorize(name: str, cmdline: str) -> str:
+    """
+    Maps a lowercased process name and command line to a process type.
+
+    Pure, so memoized: browsers spawn many children with identical command
+    lines, and suites start the same helper processes in test after test.
+    """
+    # Browser processes
+    if _BROWSER_RE.search(name):
+        # More specific categorization for Chromium-based browsers
+        for pattern, process_type in _BROWSER_SUBTYPES:
+            if pattern.search(cmdline):
+                return process_type
+        return "browser"
+    
+    # WebDriver/Selenium
+    if _WEBDRIVER_RE.search(name):
+        return "webdriver"
+    
+    # Python subprocesses
+    if "python" in name:
+        return "python"
+    
+    # Playwright/Puppeteer
+    if _AUTOMATION_RE.search(cmdline):
+        return "automation"
+    
+    # Default
+    return "other"
+
+
+_system_monitor: Optional[SystemMonitor] = None
+
+def get_system_monitor() -> SystemMonitor:
+    """
+    Returns the process-wide SystemMonitor, creating it on first use.
+
+    Creating a psutil.Process per test is wasted work since every test in a
+    worker watches the same process. A fresh instance is created after a fork.
+    """
+    global _system_monitor
+    if _system_monitor is None or _system_monitor.pid != os.getpid():
+        _system_monitor = SystemMonitor()
+    return _system_monitor
@@ -0,0 +1,231 @@
+"""Storage of per-attempt execution results for reporting."""
+
+from array import array
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Sequence
+from pytest_vigil.domains.reliability.models import ResourceLimit
+
+
+@dataclass(slots=True, frozen=True)
+class ResultRecord:
+    """One test attempt's results, as read back from a ResultBuffer."""
+    node_id: str
+    attempt: int
+    duration: float
+    max_cpu: float
+    max_memory: float
+    cpu_breakdown: Dict[str, float]
+    limits: List[Dict[str, Any]]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the record in the JSON report's per-result layout."""
+        return {
+            "node_id": self.node_id,
+            "attempt": self.attempt,
+            "duration": self.duration,
+            "max_cpu": self.max_cpu,
+            "max_memory": self.max_memory,
+            "cpu_breakdown": self.cpu_breakdown,
+            "limits": self.limits,
+        }
+
+
+class ResultBuffer:
+    """
+    Execution results stored column-wise.
+
+    One row is recorded per test attempt. Numeric columns are float/int arrays
+    rather than a dict per row. The summary statistics are folded in as rows
+    are appended, so reporting them needs no pass over the rows at all.
+
+    Most tests of a run share the same limits, so each distinct limit set is
+    serialized once and rows only store its index.
+    """
+
+    def __init__(self):
+        self.node_ids: List[str] = []
+        self.attempts = array("i")
+        self.durations = array("d")
+        self.max_cpus = array("d")
+        self.max_memories = array("d")
+        self.cpu_breakdowns: List[Dict[str, float]] = []
+        self.limit_keys = array("i")
+        # Distinct limit sets in JSON layout, indexed by `limit_keys`
+        self.limit_sets: List[List[Dict[str, Any]]] = []
+        self._limit_set_index: Dict[Hashable, int] = {}
+        # Limit sets arrive as shared tuples, so consecutive rows usually pass the
+        # same object; recognizing it skips hashing the models again
+        self._last_limits: Optional[Sequence[ResourceLimit]] = None
+        self._last_limit_key = -1
+
+        # Running summary statistics
+        self.total_duration = 0.0
+        self.total_cpu = 0.0
+        self.total_memory = 0.0
+        self.peak_cpu = 0.0
+        self.peak_memory = 0.0
+        # Row indices of the fastest and slowest attempts (first one on ties)
+        self.fastest = -1
+        self.slowest = -1
+        # Peak CPU per process type across all attempts
+        self.peak_cpu_breakdown: Dict[str, float] = {}
+
+    def __len__(self) -> int:
+        return len(self.node_ids)
+
+    @property
+    def mean_duration(self) -> float:
+        return self.total_duration / len(self.node_ids) if self.node_ids else 0.0
+
+    @property
+    def mean_cpu(self) -> float:
+        return self.total_cpu / len(self.node_ids) if self.node_ids else 0.0
+
+    @property
+    def mean_memory(self) -> float:
+        return self.total_memory / len(self.node_ids) if self.node_ids else 0.0
+
+    def append(
+        self,
+        node_id: str,
+        attempt: int,
+        duration: float,
+        max_cpu: float,
+        max_memory: float,
+        cpu_breakdown: Dict[str, float],
+        limits: Sequence[ResourceLimit],
+    ) -> None:
+        if limits is self._last_limits:
+            key = self._last_limit_key
+        else:
+            # ResourceLimit is frozen, hence hashable
+            key = self._limit_set_index.get(tuple(limits))
+            if key is None:
+                key = self._intern_limits(tuple(limits), [limit.model_dump(mode="json") for limit in limits])
+            self._last_limits, self._last_limit_key = limits, key
+        self._append(node_id, attempt, duration, max_cpu, max_memory, cpu_breakdown, key)
+
+    def _intern_limits(self, identity: Hashable, limit_set: List[Dict[str, Any]]) -> int:
+        key = len(self.limit_sets)
+        self.limit_sets.append(limit_set)
+        self._limit_set_index[identity] = key
+        return key
+
+    def _append(
+        self,
+        node_id: str,
+        attempt: int,
+        duration: float,
+        max_cpu: float,
+        max_memory: float,
+        cpu_breakdown: Dict[str, float],
+        limit_key: int,
+    ) -> None:
+        index = len(self.node_ids)
+        if index == 0:
+            self.peak_cpu, self.peak_memory = max_cpu, max_memory
+            self.fastest = self.slowest = 0
+        else:
+            if max_cpu > self.peak_cpu:
+                self.peak_cpu = max_cpu
+            if max_memory > self.peak_memory:
+                self.peak_memory = max_memory
+            if duration < self.durations[self.fastest]:
+                self.fastest = index
+            if duration > self.durations[self.slowest]:
+                self.slowest = index
+        self.total_duration += duration
+        self.total_cpu += max_cpu
+        self.total_memory += max_memory
+        peaks = self.peak_cpu_breakdown
+        for process_type, cpu_value in cpu_breakdown.items():
+            if process_type not in peaks or cpu_value > peaks[process_type]:
+                peaks[process_type] = cpu_value
+
+        self.node_ids.append(node_id)
+        self.attempts.append(attempt)
+        self.durations.append(duration)
+        self.max_cpus.append(max_cpu)
+        self.max_memories.append(max_memory)
+        self.cpu_breakdowns.append(cpu_breakdown)
+        self.limit_keys.append(limit_key)
+
+    def __iter__(self) -> Iterator[ResultRecord]:
+        """Yields one slotted record per attempt, in recording order."""
+        return map(
+            ResultRecord,
+            self.node_ids,
+            self.attempts,
+            self.durations,
+            self.max_cpus,
+            self.max_memories,
+            self.cpu_breakdowns,
+            map(self.limit_sets.__getitem__, self.limit_keys),
+        )
+
+    def to_columns(self) -> Dict[str, List[Any]]:
+        """
+        Returns the results as one plain list per column, e.g. for an xdist worker.
+
+        Only builtin types are used, as xdist's `workeroutput` requires, and
+        no per-row dicts are built or serialized.
+        """
+        return {
+            "node_ids": self.node_ids,
+            "attempts": self.attempts.tolist(),
+            "durations": self.durations.tolist(),
+            "max_cpus": self.max_cpus.tolist(),
+            "max_memories": self.max_memories.tolist(),
+            "cpu_breakdowns": self.cpu_breakdowns,
+            "limit_keys": self.limit_keys.tolist(),
+            "limit_sets": self.limit_sets,
+        }
+
+    def extend_columns(self, columns: Dict[str, List[Any]]) -> None:
+        """Appends results given in the `to_columns()` format, e.g. from an xdist worker."""
+        node_ids = columns["node_ids"]
+        if not node_ids:
+            return
+        durations = columns["durations"]
+        max_cpus = columns["max_cpus"]
+        max_memories = columns["max_memories"]
+
+        # Limit set keys are local to the sending buffer; map them onto ours
+        local_keys = []
+        for limit_set in columns["limit_sets"]:
+            identity = tuple(tuple(limit.items()) for limit in limit_set)
+            key = self._limit_set_index.get(identity)
+            if key is None:
+                key = self._intern_limits(identity, limit_set)
+            local_keys.append(key)
+
+        # Fold the running statistics per column rather than per row
+        offset = len(self.node_ids)
+        fastest = offset + durations.index(min(durations))
+        slowest = offset + durations.index(max(durations))
+        if offset == 0:
+            self.peak_cpu, self.peak_memory = max(max_cpus), max(max_memories)
+            self.fastest, self.slowest = fastest, slowest
+        else:
+            self.peak_cpu = max(self.peak_cpu, max(max_cpus))
+            self.peak_memory = max(self.peak_memory, max(max_memories))
+            if durations[fastest - offset] < self.durations[self.fastest]:
+                self.fastest = fastest
+            if durations[slowest - offset] > self.durations[self.slowest]:
+                self.slowest = slowest
+        self.total_duration += sum(durations)
+        self.total_cpu += sum(max_cpus)
+        self.total_memory += sum(max_memories)
+        peaks = self.peak_cpu_breakdown
+        for cpu_breakdown in columns["cpu_breakdowns"]:
+            for process_type, cpu_value in cpu_breakdown.items():
+                if process_type not in peaks or cpu_value > peaks[process_type]:
+                    peaks[process_type] = cpu_value
+
+        self.node_ids.extend(node_ids)
+        self.attempts.extend(columns["attempts"])
+        self.durations.extend(durations)
+        self.max_cpus.extend(max_cpus)
+        self.max_memories.extend(max_memories)
+        self.cpu_breakdowns.extend(columns["cpu_breakdowns"])
+        self.limit_keys.extend(map(local_keys.__getitem__, columns["limit_keys"]))
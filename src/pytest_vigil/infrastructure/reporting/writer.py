@@ -0,0 +1,63 @@
+"""JSON report writing."""
+
+import json
+from typing import Any, Dict, Iterable
+
+try:
+    import orjson
+except ImportError:  # Optional speedup, see the `orjson` extra
+    orjson = None
+
+# Results are written a row at a time; a large buffer batches them into few writes
+_BUFFER_SIZE = 1 << 20
+
+
+def _dumps(value: Any) -> bytes:
+    """Encodes `value` as JSON indented by 2, like the top level of the report."""
+    if orjson is not None:
+        # Like `json`, non-string dict keys (e.g. from a user's process
+        # categories) are written as strings instead of raising
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value, indent=2).encode("utf-8")
+
+
+def _dumps_line(value: Any) -> bytes:
+    """Encodes `value` as compact single-line JSON."""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+
+def write_json_report(path: str, header: Dict[str, Any], results: Iterable[Dict[str, Any]]) -> None:
+    """
+    Writes `header` followed by a "results" list as indented JSON.
+
+    Results are encoded and written one at a time, so the report is never
+    held in memory as a whole; the output is the same as dumping the full
+    document with an indent of 2. Uses orjson when it is installed, falling
+    back to the standard library.
+    """
+    with open(path, "wb", buffering=_BUFFER_SIZE) as f:
+        f.write(b"{")
+        for key, value in header.items():
+            f.write(b"\n  " + _dumps(key) + b": " + _dumps(value).replace(b"\n", b"\n  ") + b",")
+        f.write(b'\n  "results": [')
+        separator = b"\n    "
+        for row in results:
+            f.write(separator + _dumps(row).replace(b"\n", b"\n    "))
+            separator = b",\n    "
+        # An empty list stays on one line, as json.dumps writes it
+        f.write(b"]\n}" if separator == b"\n    " else b"\n  ]\n}")
+
+
+def write_jsonl_report(path: str, header: Dict[str, Any], results: Iterable[Dict[str, Any]]) -> None:
+    """
+    Writes `header` as the first line, then one line per result (JSON Lines).
+
+    Each line is a complete JSON object, so tools can process the report a
+    record at a time without loading it whole.
+    """
+    with open(path, "wb", buffering=_BUFFER_SIZE) as f:
+        f.write(_dumps_line(header) + b"\n")
+        for row in results:
+            f.write(_dumps_line(row) + b"\n")
@@ -2,33 +2,177 @@
 
 import pytest
 import os
-import json
-from datetime import datetime, timezone
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Optional, Set, Tuple, Type
 from loguru import logger
 from _pytest.runner import runtestprotocol
 from pytest_vigil.domains.reliability.models import TestExecution, ResourceLimit, InteractionType
 from pytest_vigil.domains.reliability.services import PolicyService
-from pytest_vigil.infrastructure.monitoring.loop import VigilMonitor
-from pytest_vigil.infrastructure.monitoring.session import SessionMonitor
-from pytest_vigil.infrastructure.enforcement.interrupt import Interrupter
 from pytest_vigil.infrastructure.enforcement.signals import SignalManager
+from pytest_vigil.infrastructure.reporting.results import ResultBuffer
 from pytest_vigil.config import get_settings
 
+if TYPE_CHECKING:
+    from pytest_vigil.infrastructure.enforcement.interrupt import Interrupter
+    from pytest_vigil.infrastructure.monitoring.loop import VigilMonitor
+    from pytest_vigil.infrastructure.monitoring.session import SessionMonitor
+
+# The plugin is imported on every pytest run, including runs that monitor
+# nothing. Monitoring, interruption and report writing are therefore imported
+# where first needed, so such runs never load psutil or the JSON writer.
+# loguru stays eager: its default sink binds sys.stderr when it is imported.
+
+# The monitors are held here once imported. pytester's in-process runs drop
+# modules first imported during a test from sys.modules, and every fresh
+# import of psutil leaks the previous copy.
+@lru_cache(maxsize=None)
+def _vigil_monitor_class() -> Type["VigilMonitor"]:
+    from pytest_vigil.infrastructure.monitoring.loop import VigilMonitor
+    return VigilMonitor
+
+
+@lru_cache(maxsize=None)
+def _session_monitor_class() -> Type["SessionMonitor"]:
+    from pytest_vigil.infrastructure.monitoring.session import SessionMonitor
+    return SessionMonitor
+
+
 # Store execution results for reporting
-_execution_results = []
+_execution_results = ResultBuffer()
 _flaky_tests = []
 _session_monitor = None
 _current_test_nodeid = None
 _last_test_nodeid = None
+# Stateless, so one instance serves every test of the session
+_policy_service = PolicyService()
+
+
+def _override(value: Any, convert: Callable[[Any], Any], default: Any) -> Any:
+    return default if value is None else convert(value)
+
+
+# Values of the CI variable that mark a CI run
+_CI_TRUTHY = frozenset({"true", "1", "yes", "on"})
+# Variables set by CI providers that may not set CI itself
+_CI_PROVIDER_VARS = ("GITHUB_ACTIONS", "GITLAB_CI", "BUILDKITE")
+
+
+def _detect_ci() -> bool:
+    environ = os.environ
+    return environ.get("CI", "").lower() in _CI_TRUTHY or any(environ.get(name) for name in _CI_PROVIDER_VARS)
+
+
+@dataclass(slots=True, frozen=True)
+class _VigilDefaults:
+    """
+    Policy defaults for every test of a run: settings overridden by CLI options.
+
+    Resolved once in pytest_configure; per test only marker overrides remain.
+    """
+    timeout: Optional[float]
+    memory: Optional[float]
+    cpu: Optional[float]
+    retry_count: int
+    stall_timeout: Optional[float]
+    stall_cpu_threshold: float
+    # CI multiplier for time-based limits, 1.0 outside CI
+    multiplier: float
+    strict_mode: bool
+    monitor_interval: float
+    monitor_adaptive: bool
+    # Whether sampling may back off while only time limits apply; off when the
+    # terminal report is shown or a report file is written, so their metrics
+    # rest on samples at the base interval
+    monitor_backoff: bool
+    cpu_breakdown_every: int
+    dump_stacks: bool
+
+    @classmethod
+    def from_config(cls, config: pytest.Config) -> "_VigilDefaults":
+        settings = get_settings()
+        return cls(
+            timeout=_override(config.getoption("vigil_timeout"), float, settings.timeout),
+            memory=_override(config.getoption("vigil_memory"), float, settings.memory_limit_mb),
+            cpu=_override(config.getoption("vigil_cpu"), float, settings.cpu_limit_percent),
+            retry_count=_override(config.getoption("vigil_retry"), int, settings.retry_count),
+            stall_timeout=_override(config.getoption("vigil_stall_timeout"), float, settings.stall_timeout),
+            stall_cpu_threshold=_override(
+                config.getoption("vigil_stall_cpu_threshold"), float, settings.stall_cpu_threshold
+            ),
+            multiplier=settings.ci_multiplier if _override(config.getoption("vigil_ci"), bool, _detect_ci()) else 1.0,
+            strict_mode=settings.strict_mode,
+            monitor_interval=_override(config.getoption("vigil_monitor_interval"), float, settings.monitor_interval),
+            monitor_adaptive=config.getoption("vigil_monitor_adaptive") or settings.monitor_adaptive,
+            monitor_backoff=(
+                not config.getoption("vigil_report")
+                and _override(config.getoption("vigil_cli_report_verbosity"), str, settings.report_verbosity) == "none"
+            ),
+            cpu_breakdown_every=settings.cpu_breakdown_every,
+            dump_stacks=settings.dump_stacks,
+        )
+
+    @property
+    def monitors_every_test(self) -> bool:
+        """Whether the defaults alone put limits or retries on every test."""
+        return (
+            any(v is not None for v in (self.timeout, self.memory, self.cpu, self.stall_timeout))
+            or self.retry_count > 0
+        )
+
+
+@lru_cache(maxsize=None)
+def _build_limits(
+    timeout: Optional[float],
+    memory: Optional[float],
+    cpu: Optional[float],
+    stall_timeout: Optional[float],
+    stall_threshold: float,
+    strict: bool,
+) -> Tuple[ResourceLimit, ...]:
+    """
+    Returns the limits for one combination of resolved values.
+
+    Most tests of a run resolve to the same values, so the validated models
+    are built once per combination and shared; they are frozen.
+    """
+    limits = []
+    if timeout is not None:
+        limits.append(ResourceLimit(limit_type=InteractionType.TIME, threshold=timeout, strict=strict))
+    if memory is not None:
+        limits.append(ResourceLimit(limit_type=InteractionType.MEMORY, threshold=memory, strict=strict))
+    if cpu is not None:
+        limits.append(ResourceLimit(limit_type=InteractionType.CPU, threshold=cpu, strict=strict))
+    if stall_timeout is not None:
+        limits.append(ResourceLimit(
+            limit_type=InteractionType.STALL, 
+            threshold=stall_timeout, 
+            secondary_threshold=stall_threshold,
+            strict=strict
+        ))
+    return tuple(limits)
+
+
+_defaults_key = pytest.StashKey[_VigilDefaults]()
+# Interrupter shared by every test of the run, created by the first monitored test
+_interrupter_key = pytest.StashKey["Interrupter"]()
+# Manager of the SIGALRM handler, installed for the run's session
+_signal_manager_key = pytest.StashKey[SignalManager]()
+# Node IDs of collected tests carrying a vigil marker
+_marked_nodeids_key = pytest.StashKey[Set[str]]()
 
 def pytest_sessionstart(session):
     """Initialize global result storage and session monitor."""
     global _execution_results, _flaky_tests, _session_monitor, _current_test_nodeid, _last_test_nodeid
-    _execution_results = []
+    _execution_results = ResultBuffer()
     _flaky_tests = []
     _current_test_nodeid = None
     _last_test_nodeid = None
     
+    # The SIGALRM handler stays installed for the session; each test only arms it
+    signal_manager = session.config.stash[_signal_manager_key] = SignalManager()
+    signal_manager.install()
+    
     # Setup session-level timeout if configured
     settings = get_settings()
     session_timeout = settings.session_timeout
@@ -45,18 +189,17 @@ def pytest_sessionstart(session):
     
     if session_timeout is not None and session_timeout > 0:
         # Apply CI multiplier if in CI environment
-        is_ci = os.getenv("CI", "false").lower() == "true" or os.getenv("GITHUB_ACTIONS")
-        multiplier = settings.ci_multiplier if is_ci else 1.0
+        multiplier = session.config.stash[_defaults_key].multiplier
         session_timeout *= multiplier
         
-        _session_monitor = SessionMonitor(
+        _session_monitor = _session_monitor_class()(
             timeout=session_timeout,
             grace_period=grace_period,
             get_current_test=lambda: _current_test_nodeid,
             get_last_test=lambda: _last_test_nodeid
         )
         _session_monitor.start()
-        logger.info(f"Session timeout set to {session_timeout}s (CI multiplier: {multiplier}x)")
+        logger.info("Session timeout set to {}s (CI multiplier: {}x)", session_timeout, multiplier)
 
 def pytest_addoption(parser):
     """Register command line options."""
@@ -97,12 +240,44 @@ def pytest_addoption(parser):
         dest="vigil_stall_cpu_threshold",
         help="CPU threshold in % for stall detection"
     )
+    group.addoption(
+        "--vigil-monitor-interval",
+        action="store",
+        dest="vigil_monitor_interval",
+        help="Interval in seconds between resource samples"
+    )
+    group.addoption(
+        "--vigil-monitor-adaptive",
+        action="store_true",
+        dest="vigil_monitor_adaptive",
+        help="Sample less often as a test keeps running, to cut monitoring overhead on long tests"
+    )
+    group.addoption(
+        "--vigil-ci",
+        action="store_true",
+        default=None,
+        dest="vigil_ci",
+        help="Apply the CI multiplier regardless of the environment"
+    )
+    group.addoption(
+        "--no-vigil-ci",
+        action="store_false",
+        dest="vigil_ci",
+        help="Do not apply the CI multiplier, even in a CI environment"
+    )
     group.addoption(
         "--vigil-report",
         action="store",
         dest="vigil_report",
         help="Path to generate JSON report"
     )
+    group.addoption(
+        "--vigil-report-format",
+        action="store",
+        dest="vigil_report_format",
+        choices=["json", "jsonl"],
+        help="Report file layout: json (one indented document) or jsonl (header line, then one line per result)"
+    )
     group.addoption(
         "--vigil-session-timeout",
         action="store",
@@ -126,9 +301,31 @@ def pytest_addoption(parser):
 def pytest_configure(config):
     """Configure the plugin."""
     config.addinivalue_line("markers", "vigil(**kwargs): Test reliability policies (timeout, memory, cpu, retry, stall_timeout)")
+    # Settings are cached per process; reload them so each run sees the current environment
+    get_settings.cache_clear()
+    # Settings, options and the CI environment are fixed for the run, so
+    # resolve them here rather than for every test
+    config.stash[_defaults_key] = _VigilDefaults.from_config(config)
     # Ensure loguru doesn't interfere too much with pytest capture
     pass
 
+
+def pytest_collection_finish(session):
+    """
+    Record which tests carry a vigil marker so unmarked ones skip the policy setup.
+
+    Done once collection is final, so markers added by any plugin's
+    pytest_collection_modifyitems are seen.
+    """
+    session.config.stash[_marked_nodeids_key] = {
+        item.nodeid for item in session.items if item.get_closest_marker("vigil")
+    }
+
+
+def pytest_unconfigure(config):
+    """Drop this run's settings snapshot so an enclosing run does not reuse it."""
+    get_settings.cache_clear()
+
 @pytest.hookimpl(tryfirst=True)
 def pytest_runtest_setup(item):
     """Track which test is currently running for session timeout reporting."""
@@ -154,8 +351,11 @@ def pytest_sessionfinish(session, exitstatus):
         _session_monitor.stop()
         _session_monitor = None
     
+    # Put back the SIGALRM handler that was active before the session
+    session.config.stash[_signal_manager_key].uninstall()
+    
     if hasattr(session.config, "workeroutput"):
-        session.config.workeroutput["vigil_results"] = _execution_results
+        session.config.workeroutput["vigil_results"] = _execution_results.to_columns()
         session.config.workeroutput["vigil_flaky_tests"] = _flaky_tests
 
 def pytest_testnodedown(node, error):
@@ -164,7 +364,7 @@ def pytest_testnodedown(node, error):
     """
     if hasattr(node, "workeroutput"):
         if "vigil_results" in node.workeroutput:
-            _execution_results.extend(node.workeroutput["vigil_results"])
+            _execution_results.extend_columns(node.workeroutput["vigil_results"])
         if "vigil_flaky_tests" in node.workeroutput:
             _flaky_tests.extend(node.workeroutput["vigil_flaky_tests"])
 
@@ -174,44 +374,21 @@ def pytest_runtest_protocol(item, nextitem):
     Wrap the test execution to enforce limits and retry logic.
     Replaces standard runtestprotocol to enable per-attempt monitoring.
     """
-    settings = get_settings()
-    
-    # CI Detection
-    is_ci = os.getenv("CI", "false").lower() == "true" or os.getenv("GITHUB_ACTIONS")
-    multiplier = settings.ci_multiplier if is_ci else 1.0
-
-    # 1. Defaults from Settings
-    timeout_val = settings.timeout
-    memory_val = settings.memory_limit_mb
-    cpu_val = settings.cpu_limit_percent
-    retry_count = settings.retry_count
-    stall_timeout = settings.stall_timeout
-    stall_threshold = settings.stall_cpu_threshold
-
-    # 2. Overrides from CLI
-    cli_timeout = item.config.getoption("vigil_timeout")
-    if cli_timeout is not None:
-        timeout_val = float(cli_timeout)
-    
-    cli_memory = item.config.getoption("vigil_memory")
-    if cli_memory is not None:
-        memory_val = float(cli_memory)
-        
-    cli_cpu = item.config.getoption("vigil_cpu")
-    if cli_cpu is not None:
-        cpu_val = float(cli_cpu)
-        
-    cli_retry = item.config.getoption("vigil_retry")
-    if cli_retry is not None:
-        retry_count = int(cli_retry)
-    
-    cli_stall_timeout = item.config.getoption("vigil_stall_timeout")
-    if cli_stall_timeout is not None:
-        stall_timeout = float(cli_stall_timeout)
-    
-    cli_stall_threshold = item.config.getoption("vigil_stall_cpu_threshold")
-    if cli_stall_threshold is not None:
-        stall_threshold = float(cli_stall_threshold)
+    # 1. Defaults from Settings, 2. overridden by CLI (resolved in pytest_configure)
+    defaults = item.config.stash[_defaults_key]
+    # Without defaults only marked tests are monitored; leave the rest to the default runner
+    if not defaults.monitors_every_test:
+        marked = item.config.stash.get(_marked_nodeids_key, None)
+        if marked is not None and item.nodeid not in marked:
+            return None
+    timeout_val = defaults.timeout
+    memory_val = defaults.memory
+    cpu_val = defaults.cpu
+    retry_count = defaults.retry_count
+    stall_timeout = defaults.stall_timeout
+    stall_threshold = defaults.stall_cpu_threshold
+    multiplier = defaults.multiplier
+    strict_mode = defaults.strict_mode
 
     # 3. Overrides from Markers
     marker = item.get_closest_marker("vigil")
@@ -233,120 +410,105 @@ def pytest_runtest_protocol(item, nextitem):
     if all(v is None for v in [timeout_val, memory_val, cpu_val, stall_timeout]) and retry_count == 0:
         return None
 
-    # Apply Multiplier
-    if timeout_val is not None:
-        timeout_val *= multiplier
-    if stall_timeout is not None:
-        stall_timeout *= multiplier
+    # Apply Multiplier (1.0 outside CI, where there is nothing to scale)
+    if multiplier != 1.0:
+        if timeout_val is not None:
+            timeout_val *= multiplier
+        if stall_timeout is not None:
+            stall_timeout *= multiplier
 
-    limits = []
-    if timeout_val is not None:
-        limits.append(ResourceLimit(limit_type=InteractionType.TIME, threshold=timeout_val, strict=settings.strict_mode))
-    if memory_val is not None:
-        limits.append(ResourceLimit(limit_type=InteractionType.MEMORY, threshold=memory_val, strict=settings.strict_mode))
-    if cpu_val is not None:
-        limits.append(ResourceLimit(limit_type=InteractionType.CPU, threshold=cpu_val, strict=settings.strict_mode))
-    if stall_timeout is not None:
-        limits.append(ResourceLimit(
-            limit_type=InteractionType.STALL, 
-            threshold=stall_timeout, 
-            secondary_threshold=stall_threshold,
-            strict=settings.strict_mode
-        ))
+    limits = _build_limits(timeout_val, memory_val, cpu_val, stall_timeout, stall_threshold, strict_mode)
 
-    interrupter = Interrupter()
-    signal_manager = SignalManager()
-    signal_manager.install()
-    policy_service = PolicyService()
+    VigilMonitor = _vigil_monitor_class()
+
+    interrupter = item.config.stash.get(_interrupter_key, None)
+    if interrupter is None:
+        from pytest_vigil.infrastructure.enforcement.interrupt import Interrupter
+        interrupter = item.config.stash[_interrupter_key] = Interrupter(dump_stacks=defaults.dump_stacks)
+    signal_manager = item.config.stash[_signal_manager_key]
+
+    def on_violation(limit: ResourceLimit):
+        interrupter.trigger(f"Policy violation: {limit}")
 
     reports = []
     global _current_test_nodeid
     
+    # Resolve the hook callers once rather than through item.ihook on every call
+    ihook = item.ihook
+    logreport = ihook.pytest_runtest_logreport
+    logfinish = ihook.pytest_runtest_logfinish
+
+    # Retried attempts are not reported, so the test starts and finishes once
+    ihook.pytest_runtest_logstart(nodeid=item.nodeid, location=item.location)
     try:
         for attempt in range(retry_count + 1):
             # Track current test for session timeout reporting
             _current_test_nodeid = item.nodeid
             
-            item.ihook.pytest_runtest_logstart(nodeid=item.nodeid, location=item.location)
-            
-            execution = TestExecution(item_id=item.nodeid, node_id=item.nodeid, retry_attempt=attempt)
-            
-            def on_violation(limit: ResourceLimit):
-                interrupter.trigger(f"Policy violation: {limit}")
+            execution = TestExecution(
+                item_id=item.nodeid,
+                node_id=item.nodeid,
+                retry_attempt=attempt,
+                # Only stall detection needs sample history, and only its window;
+                # peaks are tracked as samples arrive
+                sample_window=stall_timeout if stall_timeout is not None else 0.0,
+            )
 
             monitor = VigilMonitor(
                 execution=execution,
                 limits=limits,
-                policy_service=policy_service,
+                policy_service=_policy_service,
                 on_violation=on_violation,
-                interval=settings.monitor_interval
+                interval=defaults.monitor_interval,
+                detailed_every=defaults.cpu_breakdown_every,
+                adaptive=defaults.monitor_adaptive,
+                backoff=defaults.monitor_backoff
             )
             
+            # Only interrupts delivered while the test runs may raise TimeoutException
+            signal_manager.arm()
             monitor.start()
             
             try:
                 # Run the standard protocol for this item
                 reports = runtestprotocol(item, nextitem=nextitem, log=False)
-            except KeyboardInterrupt:
-                monitor.stop()
-                raise
-            except Exception:
-                monitor.stop()
-                raise
             finally:
+                # Disarm first: stop() may wait out a tick that is still
+                # interrupting, and that interrupt must not escape the test
+                signal_manager.restore()
                 monitor.stop()
             
             # Record stats
-            if execution.measurements:
-                max_cpu = max(m.cpu_percent for m in execution.measurements)
-                max_mem = max(m.memory_mb for m in execution.measurements)
-                
-                # Aggregate CPU breakdown: collect peak CPU for each process type
-                cpu_breakdown_aggregate = {}
-                for m in execution.measurements:
-                    for process_type, cpu_value in m.cpu_breakdown.items():
-                        if process_type not in cpu_breakdown_aggregate:
-                            cpu_breakdown_aggregate[process_type] = cpu_value
-                        else:
-                            cpu_breakdown_aggregate[process_type] = max(
-                                cpu_breakdown_aggregate[process_type],
-                                cpu_value
-                            )
-                
-                _execution_results.append({
-                    "node_id": item.nodeid,
-                    "attempt": attempt,
-                    "duration": execution.duration,
-                    "max_cpu": max_cpu,
-                    "max_memory": max_mem,
-                    "cpu_breakdown": cpu_breakdown_aggregate,
-                    "limits": [limit.model_dump(mode='json') for limit in limits]
-                })
-
-            # Check if passed
-            failed = any(r.failed for r in reports)
-            
-            # Report only if passed or if it's the final attempt
-            if not failed or attempt == retry_count:
-                for r in reports:
-                    item.ihook.pytest_runtest_logreport(report=r)
-
-            if not failed:
-                if attempt > 0:
-                    _flaky_tests.append(item.nodeid)
-                item.ihook.pytest_runtest_logfinish(nodeid=item.nodeid, location=item.location)
-                _current_test_nodeid = None
-                return True
-            
-            # If failed and attempts left
-            if attempt < retry_count:
+            if execution.cpu_samples:
+                _execution_results.append(
+                    node_id=item.nodeid,
+                    attempt=attempt,
+                    duration=execution.duration,
+                    max_cpu=execution.max_cpu,
+                    max_memory=execution.max_memory,
+                    cpu_breakdown=execution.cpu_breakdown,
+                    limits=limits
+                )
+
+            # Only a failing test body is retried; setup and teardown errors are
+            # reported right away. Reports of a retried attempt are not logged.
+            call_report = next((r for r in reports if r.when == "call"), None)
+            if attempt < retry_count and call_report is not None and call_report.failed:
                 logger.warning(f"Test {item.nodeid} failed attempt {attempt+1}/{retry_count+1}. Retrying...")
-            else:
-                item.ihook.pytest_runtest_logfinish(nodeid=item.nodeid, location=item.location)
+                continue
+
+            # Reports are logged either way, so check them in the same pass
+            failed = False
+            for r in reports:
+                failed = failed or r.failed
+                logreport(report=r)
+            if attempt > 0 and not failed:
+                _flaky_tests.append(item.nodeid)
+            logfinish(nodeid=item.nodeid, location=item.location)
+            return True
                 
     finally:
         _current_test_nodeid = None
-        signal_manager.restore()
 
     return True
 
@@ -377,37 +539,27 @@ def pytest_terminal_summary(terminalreporter, exitstatus, config):
 
     # Short verbosity: show summary statistics only
     if verbosity == "short":
-        total_count = len(_execution_results)
-        durations = [r["duration"] for r in _execution_results]
-        cpu_values = [r["max_cpu"] for r in _execution_results]
-        memory_values = [r["max_memory"] for r in _execution_results]
+        results = _execution_results
+        total_count = len(results)
+        durations = results.durations
+        node_ids = results.node_ids
         
-        avg_duration = sum(durations) / total_count
-        slowest = max(_execution_results, key=lambda r: r["duration"])
-        fastest = min(_execution_results, key=lambda r: r["duration"])
-        avg_cpu = sum(cpu_values) / total_count
-        avg_memory = sum(memory_values) / total_count
-        peak_cpu = max(cpu_values)
-        peak_memory = max(memory_values)
+        # Totals, means and extremes are kept by the buffer as rows are added,
+        # so none of this walks the rows
+        slowest = results.slowest
+        fastest = results.fastest
         
         terminalreporter.write_line(f"Total Tests: {total_count}")
-        terminalreporter.write_line(f"Average Duration: {avg_duration:.2f}s")
-        terminalreporter.write_line(f"Fastest Test: {fastest['duration']:.2f}s ({fastest['node_id'].split('::')[-1]})")
-        terminalreporter.write_line(f"Slowest Test: {slowest['duration']:.2f}s ({slowest['node_id'].split('::')[-1]})")
-        terminalreporter.write_line(f"Average CPU: {avg_cpu:.1f}%")
-        terminalreporter.write_line(f"Peak CPU: {peak_cpu:.1f}%")
-        terminalreporter.write_line(f"Average Memory: {avg_memory:.1f} MB")
-        terminalreporter.write_line(f"Peak Memory: {peak_memory:.1f} MB")
+        terminalreporter.write_line(f"Average Duration: {results.mean_duration:.2f}s")
+        terminalreporter.write_line(f"Fastest Test: {durations[fastest]:.2f}s ({node_ids[fastest].split('::')[-1]})")
+        terminalreporter.write_line(f"Slowest Test: {durations[slowest]:.2f}s ({node_ids[slowest].split('::')[-1]})")
+        terminalreporter.write_line(f"Average CPU: {results.mean_cpu:.1f}%")
+        terminalreporter.write_line(f"Peak CPU: {results.peak_cpu:.1f}%")
+        terminalreporter.write_line(f"Average Memory: {results.mean_memory:.1f} MB")
+        terminalreporter.write_line(f"Peak Memory: {results.peak_memory:.1f} MB")
         
-        # Aggregate CPU breakdown across all tests
-        total_breakdown = {}
-        for r in _execution_results:
-            breakdown = r.get("cpu_breakdown", {})
-            for process_type, cpu_value in breakdown.items():
-                if process_type not in total_breakdown:
-                    total_breakdown[process_type] = cpu_value
-                else:
-                    total_breakdown[process_type] = max(total_breakdown[process_type], cpu_value)
+        # CPU breakdown aggregated across all tests
+        total_breakdown = results.peak_cpu_breakdown
         
         if total_breakdown:
             terminalreporter.write_line("\nPeak CPU by Process Type:")
@@ -422,34 +574,44 @@ def pytest_terminal_summary(terminalreporter, exitstatus, config):
         headers = ["Test ID", "Att", "Duration (s)", "Max CPU (%)", "Max Mem (MB)"]
         
         # Find longest ID
-        max_len = max((len(r["node_id"]) for r in _execution_results), default=20)
+        max_len = max(map(len, _execution_results.node_ids), default=20)
         # Ensure min length
         max_len = max(max_len, 20)
         
         fmt = f"{{:<{max_len}}} {{:>3}} {{:>12}} {{:>12}} {{:>12}}"
+        row_fmt = f"{{:<{max_len}}} {{:>3}} {{:>12.2f}} {{:>12.1f}} {{:>12.1f}}"
         
-        terminalreporter.write_line(fmt.format(*headers))
-        terminalreporter.write_line("-" * (max_len + 50))
-        
-        for res in _execution_results:
-            terminalreporter.write_line(fmt.format(
-                res["node_id"],
-                res["attempt"],
-                f"{res['duration']:.2f}",
-                f"{res['max_cpu']:.1f}",
-                f"{res['max_memory']:.1f}"
-            ))
+        # Format straight from the result columns and write the table in one go
+        results = _execution_results
+        lines = [fmt.format(*headers), "-" * (max_len + 50)]
+        lines.extend(map(
+            row_fmt.format,
+            results.node_ids,
+            results.attempts,
+            results.durations,
+            results.max_cpus,
+            results.max_memories,
+        ))
+        terminalreporter.write_line("\n".join(lines))
 
     # JSON Report
     report_path = config.getoption("vigil_report")
     if report_path:
+        import time
+        from datetime import datetime, timezone
+        from pytest_vigil.infrastructure.reporting.writer import write_json_report, write_jsonl_report
+
+        now_ns = time.time_ns()
         data = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            # One clock reading: exact epoch nanoseconds for tools, ISO 8601 for people
+            "timestamp": datetime.fromtimestamp(now_ns / 1e9, timezone.utc).isoformat(),
+            "timestamp_ns": now_ns,
             "flaky_tests": _flaky_tests,
-            "results": _execution_results
         }
-        with open(report_path, "w") as f:
-            json.dump(data, f, indent=2)
+        report_format = config.getoption("vigil_report_format") or settings.report_format
+        write_report = write_jsonl_report if report_format == "jsonl" else write_json_report
+        # Rows are built one at a time as the writer streams them out
+        write_report(report_path, data, (record.to_dict() for record in _execution_results))
         terminalreporter.write_line(f"\nSaved Vigil report to {report_path}")
 
 
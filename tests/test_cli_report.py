@@ -20,6 +20,17 @@ import json
 pytest_plugins = ["pytester"]
 
 
+# The single passing test most report checks run against
+SAMPLE_TEST = """
+    import pytest
+    import time
+
+    @pytest.mark.vigil(timeout=2.0)
+    def test_sample():
+        time.sleep(0.001)
+"""
+
+
 # =============================================================================
 # 1. BASIC FUNCTIONALITY TESTS
 # =============================================================================
@@ -66,14 +77,7 @@ class TestBasicReportVerbosity:
     
     def test_verbosity_none_hides_report(self, pytester):
         """Verify verbosity=none completely hides the report."""
-        pytester.makepyfile("""
-            import pytest
-            import time
-
-            @pytest.mark.vigil(timeout=2.0)
-            def test_sample():
-                time.sleep(0.1)
-        """)
+        pytester.makepyfile(SAMPLE_TEST)
         
         result = pytester.runpytest("--vigil-cli-report-verbosity=none")
         output = result.stdout.str()
@@ -347,14 +351,7 @@ class TestReportConfiguration:
     
     def test_env_variable_sets_verbosity(self, pytester, monkeypatch):
         """Verify PYTEST_VIGIL__REPORT_VERBOSITY environment variable works."""
-        pytester.makepyfile("""
-            import pytest
-            import time
-
-            @pytest.mark.vigil(timeout=2.0)
-            def test_sample():
-                time.sleep(0.1)
-        """)
+        pytester.makepyfile(SAMPLE_TEST)
         
         # Set environment variable
         monkeypatch.setenv("PYTEST_VIGIL__REPORT_VERBOSITY", "none")
@@ -368,14 +365,7 @@ class TestReportConfiguration:
     
     def test_cli_overrides_env_variable(self, pytester, monkeypatch):
         """Verify CLI option overrides environment variable."""
-        pytester.makepyfile("""
-            import pytest
-            import time
-
-            @pytest.mark.vigil(timeout=2.0)
-            def test_sample():
-                time.sleep(0.1)
-        """)
+        pytester.makepyfile(SAMPLE_TEST)
         
         # Set env to none
         monkeypatch.setenv("PYTEST_VIGIL__REPORT_VERBOSITY", "none")
@@ -390,14 +380,7 @@ class TestReportConfiguration:
     
     def test_invalid_verbosity_value_rejected(self, pytester):
         """Verify invalid verbosity values are rejected."""
-        pytester.makepyfile("""
-            import pytest
-            import time
-
-            @pytest.mark.vigil(timeout=2.0)
-            def test_sample():
-                time.sleep(0.1)
-        """)
+        pytester.makepyfile(SAMPLE_TEST)
         
         result = pytester.runpytest("--vigil-cli-report-verbosity=invalid")
         
@@ -414,14 +397,7 @@ class TestReportInCIEnvironment:
     
     def test_report_works_in_ci_environment(self, pytester, monkeypatch):
         """Verify report displays correctly in CI environment."""
-        pytester.makepyfile("""
-            import pytest
-            import time
-
-            @pytest.mark.vigil(timeout=2.0)
-            def test_sample():
-                time.sleep(0.1)
-        """)
+        pytester.makepyfile(SAMPLE_TEST)
         
         # Simulate CI environment
         monkeypatch.setenv("CI", "true")
@@ -587,27 +563,26 @@ class TestReportEdgeCases:
         """Verify short verbosity with exactly 5 tests."""
         pytester.makepyfile("""
             import pytest
-            import time
 
             @pytest.mark.vigil(timeout=2.0)
             def test_1():
-                time.sleep(0.01)
+                pass
             
             @pytest.mark.vigil(timeout=2.0)
             def test_2():
-                time.sleep(0.01)
+                pass
             
             @pytest.mark.vigil(timeout=2.0)
             def test_3():
-                time.sleep(0.01)
+                pass
             
             @pytest.mark.vigil(timeout=2.0)
             def test_4():
-                time.sleep(0.01)
+                pass
             
             @pytest.mark.vigil(timeout=2.0)
             def test_5():
-                time.sleep(0.01)
+                pass
         """)
         
         result = pytester.runpytest("--vigil-cli-report-verbosity=short")
@@ -623,11 +598,10 @@ class TestReportEdgeCases:
         """Verify report with single test shows summary."""
         pytester.makepyfile("""
             import pytest
-            import time
 
             @pytest.mark.vigil(timeout=2.0)
             def test_single():
-                time.sleep(0.05)
+                pass
         """)
         
         result = pytester.runpytest("--vigil-cli-report-verbosity=short")
@@ -642,13 +616,12 @@ class TestReportEdgeCases:
         """Verify report handles long test paths gracefully."""
         # Create nested directory structure
         test_dir = pytester.mkpydir("very_long_directory_name_for_testing")
-        test_dir.joinpath("test_file_with_long_name.py").write_text("""
+        test_dir.joinpath("test_file_with_long_name.py").write_bytes(b"""
 import pytest
-import time
 
 @pytest.mark.vigil(timeout=2.0)
 def test_with_very_long_function_name_that_might_break_formatting():
-    time.sleep(0.05)
+    pass
 """)
         
         result = pytester.runpytest("--vigil-cli-report-verbosity=full")
@@ -657,28 +630,6 @@ def test_with_very_long_function_name_that_might_break_formatting():
         # Should show report without formatting issues
         assert "Vigil Reliability Report" in output
         assert result.ret == 0
-    
-    def test_report_with_retried_tests(self, pytester):
-        """Verify report shows retry attempts correctly."""
-        pytester.makepyfile("""
-            import pytest
-
-            counter = 0
-
-            @pytest.mark.vigil(timeout=2.0, retry=2)
-            def test_retry():
-                global counter
-                counter += 1
-                assert counter >= 2
-        """)
-        
-        result = pytester.runpytest("--vigil-cli-report-verbosity=full")
-        output = result.stdout.str()
-        
-        # Should show report with flaky test warning
-        assert "Vigil Reliability Report" in output
-        assert "Flaky Tests" in output
-        assert result.ret == 0
 
 
 # =============================================================================
@@ -692,31 +643,11 @@ class TestReportWithJsonGeneration:
         """Verify JSON report contains all data regardless of CLI verbosity."""
         pytester.makepyfile("""
             import pytest
-            import time
 
+            @pytest.mark.parametrize("i", range(6))
             @pytest.mark.vigil(timeout=2.0)
-            def test_1():
-                time.sleep(0.05)
-            
-            @pytest.mark.vigil(timeout=2.0)
-            def test_2():
-                time.sleep(0.05)
-            
-            @pytest.mark.vigil(timeout=2.0)
-            def test_3():
-                time.sleep(0.05)
-            
-            @pytest.mark.vigil(timeout=2.0)
-            def test_4():
-                time.sleep(0.05)
-            
-            @pytest.mark.vigil(timeout=2.0)
-            def test_5():
-                time.sleep(0.05)
-            
-            @pytest.mark.vigil(timeout=2.0)
-            def test_6():
-                time.sleep(0.05)
+            def test_n(i):
+                pass
         """)
         
         report_file = "vigil_report.json"
@@ -734,20 +665,42 @@ class TestReportWithJsonGeneration:
         
         # JSON report should have all 6 tests
         report_path = pytester.path / report_file
-        with open(report_path) as f:
-            data = json.load(f)
+        data = json.loads(report_path.read_bytes())
         
         assert len(data["results"]) == 6
     
+    def test_jsonl_report_format(self, pytester):
+        """Verify the JSON Lines report holds a header line and one line per result."""
+        pytester.makepyfile("""
+            import pytest
+
+            @pytest.mark.vigil(timeout=2.0)
+            def test_1():
+                pass
+
+            @pytest.mark.vigil(timeout=2.0)
+            def test_2():
+                pass
+        """)
+        
+        report_file = "vigil_report.jsonl"
+        result = pytester.runpytest(f"--vigil-report={report_file}", "--vigil-report-format=jsonl")
+        
+        assert result.ret == 0
+        lines = [json.loads(line) for line in (pytester.path / report_file).read_bytes().splitlines()]
+        
+        header, rows = lines[0], lines[1:]
+        assert set(header) == {"timestamp", "timestamp_ns", "flaky_tests"}
+        assert [row["node_id"].split("::")[-1] for row in rows] == ["test_1", "test_2"]
+    
     def test_json_report_with_verbosity_none(self, pytester):
         """Verify JSON report message shown even when CLI verbosity is none."""
         pytester.makepyfile("""
             import pytest
-            import time
 
             @pytest.mark.vigil(timeout=2.0)
             def test_sample():
-                time.sleep(0.1)
+                pass
         """)
         
         report_file = "vigil_report.json"
@@ -854,7 +807,7 @@ class TestReportNonInterference:
 
             @pytest.mark.vigil(timeout=2.0, memory=500, cpu=200)
             def test_all_limits():
-                time.sleep(0.1)
+                time.sleep(0.001)
         """)
         
         result = pytester.runpytest("--vigil-cli-report-verbosity=full")
@@ -872,95 +825,66 @@ class TestReportNonInterference:
 class TestReportContent:
     """Test that CLI report displays correct data."""
     
-    def test_report_shows_attempt_number(self, pytester):
-        """Verify full report shows attempt number for retried tests."""
-        pytester.makepyfile("""
-            import pytest
-
-            counter = 0
-
-            @pytest.mark.vigil(timeout=2.0, retry=2)
-            def test_retry():
-                global counter
-                counter += 1
-                assert counter >= 2
-        """)
-        
-        result = pytester.runpytest("--vigil-cli-report-verbosity=full")
-        output = result.stdout.str()
-        
-        # Should show attempt column in full mode
-        assert "Att" in output
-        assert result.ret == 0
+    # One file covers a plain test and a retried one, so each verbosity mode
+    # needs a single run to check every column and statistic
+    CONTENT_TESTS = """
+        import pytest
+
+        counter = 0
+
+        @pytest.mark.vigil(timeout=2.0)
+        def test_sample():
+            pass
+
+        @pytest.mark.vigil(timeout=2.0, retry=2)
+        def test_retry():
+            global counter
+            counter += 1
+            assert counter >= 2
+    """
     
-    def test_report_shows_duration(self, pytester):
-        """Verify report shows test duration in both modes."""
-        pytester.makepyfile("""
-            import pytest
-            import time
-
-            @pytest.mark.vigil(timeout=2.0)
-            def test_timed():
-                time.sleep(0.2)
-        """)
+    def test_full_report_content(self, pytester):
+        """Verify the full report shows every column and warns about the retried test."""
+        pytester.makepyfile(self.CONTENT_TESTS)
         
-        # Test full mode
         result = pytester.runpytest("--vigil-cli-report-verbosity=full")
         output = result.stdout.str()
-        assert "Duration (s)" in output
         
-        # Test short mode
-        result = pytester.runpytest("--vigil-cli-report-verbosity=short")
-        output = result.stdout.str()
-        assert "Average Duration:" in output
+        assert "Vigil Reliability Report" in output
+        for header in ("Test ID", "Att", "Duration (s)", "Max CPU (%)", "Max Mem (MB)"):
+            assert header in output
+        # Should have separator line
+        assert "---" in output
+        assert "Flaky Tests" in output
         assert result.ret == 0
     
-    def test_report_shows_resource_metrics(self, pytester):
-        """Verify report shows CPU and memory metrics."""
-        pytester.makepyfile("""
-            import pytest
-            import time
-
-            @pytest.mark.vigil(timeout=2.0)
-            def test_sample():
-                time.sleep(0.1)
-        """)
+    def test_short_report_content(self, pytester):
+        """Verify the short report shows duration and resource statistics."""
+        pytester.makepyfile(self.CONTENT_TESTS)
         
-        # Test full mode
-        result = pytester.runpytest("--vigil-cli-report-verbosity=full")
-        output = result.stdout.str()
-        assert "Max CPU (%)" in output
-        assert "Max Mem (MB)" in output
-        
-        # Test short mode
         result = pytester.runpytest("--vigil-cli-report-verbosity=short")
         output = result.stdout.str()
-        assert "Average CPU:" in output
-        assert "Peak CPU:" in output
-        assert "Average Memory:" in output
-        assert "Peak Memory:" in output
+        
+        for statistic in ("Average Duration:", "Average CPU:", "Peak CPU:", "Average Memory:", "Peak Memory:"):
+            assert statistic in output
         assert result.ret == 0
-    
-    def test_report_table_formatting(self, pytester):
-        """Verify full report table is properly formatted."""
+
+    def test_short_report_samples_time_only_tests(self, pytester):
+        """Verify a far time limit does not thin out the samples behind the summary."""
         pytester.makepyfile("""
-            import pytest
             import time
 
-            @pytest.mark.vigil(timeout=2.0)
-            def test_sample():
-                time.sleep(0.1)
+            def test_busy():
+                end = time.monotonic() + 0.8
+                while time.monotonic() < end:
+                    pass
         """)
-        
-        result = pytester.runpytest("--vigil-cli-report-verbosity=full")
-        output = result.stdout.str()
-        
-        # Should have proper table structure
-        assert "Vigil Reliability Report" in output
-        assert "Test ID" in output
-        # Should have separator line
-        assert "---" in output
+
+        result = pytester.runpytest("--vigil-timeout=30")
+
         assert result.ret == 0
+        peak_line = next(line for line in result.outlines if line.startswith("Peak CPU:"))
+        assert float(peak_line.split(":")[1].strip().rstrip("%")) > 0
 
 
 # =============================================================================
@@ -972,14 +896,7 @@ class TestCPUBreakdownFunctionality:
     
     def test_cpu_breakdown_appears_in_short_report(self, pytester):
         """Verify CPU breakdown appears in short verbosity report."""
-        pytester.makepyfile("""
-            import pytest
-            import time
-
-            @pytest.mark.vigil(timeout=2.0)
-            def test_sample():
-                time.sleep(0.1)
-        """)
+        pytester.makepyfile(SAMPLE_TEST)
         
         result = pytester.runpytest("--vigil-cli-report-verbosity=short")
         output = result.stdout.str()
@@ -992,14 +909,7 @@ class TestCPUBreakdownFunctionality:
     
     def test_cpu_breakdown_not_in_full_report(self, pytester):
         """Verify CPU breakdown is only shown in short mode, not full table mode."""
-        pytester.makepyfile("""
-            import pytest
-            import time
-
-            @pytest.mark.vigil(timeout=2.0)
-            def test_sample():
-                time.sleep(0.1)
-        """)
+        pytester.makepyfile(SAMPLE_TEST)
         
         result = pytester.runpytest("--vigil-cli-report-verbosity=full")
         output = result.stdout.str()
@@ -1013,14 +923,7 @@ class TestCPUBreakdownFunctionality:
     
     def test_cpu_breakdown_not_shown_with_verbosity_none(self, pytester):
         """Verify CPU breakdown is hidden when verbosity is none."""
-        pytester.makepyfile("""
-            import pytest
-            import time
-
-            @pytest.mark.vigil(timeout=2.0)
-            def test_sample():
-                time.sleep(0.1)
-        """)
+        pytester.makepyfile(SAMPLE_TEST)
         
         result = pytester.runpytest("--vigil-cli-report-verbosity=none")
         output = result.stdout.str()
@@ -1060,14 +963,7 @@ class TestCPUBreakdownFunctionality:
     
     def test_cpu_breakdown_in_json_report(self, pytester):
         """Verify CPU breakdown is included in JSON report."""
-        pytester.makepyfile("""
-            import pytest
-            import time
-
-            @pytest.mark.vigil(timeout=2.0)
-            def test_sample():
-                time.sleep(0.1)
-        """)
+        pytester.makepyfile(SAMPLE_TEST)
         
         report_file = "vigil_cpu_breakdown.json"
         result = pytester.runpytest(
@@ -1079,8 +975,7 @@ class TestCPUBreakdownFunctionality:
         
         # Check JSON report contains cpu_breakdown
         report_path = pytester.path / report_file
-        with open(report_path) as f:
-            data = json.load(f)
+        data = json.loads(report_path.read_bytes())
         
         assert len(data["results"]) > 0
         # Check that cpu_breakdown field exists
@@ -1160,19 +1055,19 @@ class TestCPUBreakdownFunctionality:
 
             @pytest.mark.vigil(timeout=2.0)
             def test_1():
-                time.sleep(0.1)
+                time.sleep(0.001)
             
             @pytest.mark.vigil(timeout=2.0)
             def test_2():
-                time.sleep(0.1)
+                time.sleep(0.001)
             
             @pytest.mark.vigil(timeout=2.0)
             def test_3():
-                time.sleep(0.1)
+                time.sleep(0.001)
             
             @pytest.mark.vigil(timeout=2.0)
             def test_4():
-                time.sleep(0.1)
+                time.sleep(0.001)
         """)
         
         result = pytester.runpytest("-n", "2", "--vigil-cli-report-verbosity=short")
@@ -1192,11 +1087,11 @@ class TestCPUBreakdownFunctionality:
 
             @pytest.mark.vigil(timeout=2.0)
             def test_1():
-                time.sleep(0.1)
+                time.sleep(0.001)
             
             @pytest.mark.vigil(timeout=2.0)
             def test_2():
-                time.sleep(0.1)
+                time.sleep(0.001)
         """)
         
         report_file = "vigil_xdist_breakdown.json"
@@ -1210,8 +1105,7 @@ class TestCPUBreakdownFunctionality:
         
         # Check JSON report
         report_path = pytester.path / report_file
-        with open(report_path) as f:
-            data = json.load(f)
+        data = json.loads(report_path.read_bytes())
         
         # Should have results from both workers
         assert len(data["results"]) == 2
@@ -1241,14 +1135,7 @@ class TestCPUBreakdownFunctionality:
     
     def test_cpu_breakdown_capitalized_process_names(self, pytester):
         """Verify process type names are capitalized in report."""
-        pytester.makepyfile("""
-            import pytest
-            import time
-
-            @pytest.mark.vigil(timeout=2.0)
-            def test_sample():
-                time.sleep(0.1)
-        """)
+        pytester.makepyfile(SAMPLE_TEST)
         
         result = pytester.runpytest("--vigil-cli-report-verbosity=short")
         output = result.stdout.str()
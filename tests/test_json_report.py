@@ -18,19 +18,23 @@ from pathlib import Path
 pytest_plugins = ["pytester"]
 
 
+# The single passing test most report checks run against
+SAMPLE_TEST = """
+    import pytest
+    import time
+
+    @pytest.mark.vigil(timeout=2.0)
+    def test_sample():
+        time.sleep(0.001)
+"""
+
+
 class TestBasicReportGeneration:
     """Test basic JSON report generation functionality."""
     
     def test_report_structure(self, pytester):
         """Verify JSON report has correct structure and required fields."""
-        pytester.makepyfile("""
-            import pytest
-            import time
-
-            @pytest.mark.vigil(timeout=2.0)
-            def test_sample():
-                time.sleep(0.1)
-        """)
+        pytester.makepyfile(SAMPLE_TEST)
         
         report_file = "vigil_report.json"
         result = pytester.runpytest(f"--vigil-report={report_file}")
@@ -39,8 +43,7 @@ class TestBasicReportGeneration:
         report_path = pytester.path / report_file
         assert report_path.exists()
         
-        with open(report_path) as f:
-            data = json.load(f)
+        data = json.loads(report_path.read_bytes())
         
         # Verify top-level structure
         assert "timestamp" in data
@@ -49,7 +52,10 @@ class TestBasicReportGeneration:
         
         # Verify timestamp is ISO 8601
         from datetime import datetime
-        datetime.fromisoformat(data["timestamp"])
+        timestamp = datetime.fromisoformat(data["timestamp"])
+        # Both fields come from the same clock reading
+        assert isinstance(data["timestamp_ns"], int)
+        assert abs(timestamp.timestamp() - data["timestamp_ns"] / 1e9) < 1e-3
         
         # Verify results structure
         assert isinstance(data["results"], list)
@@ -65,14 +71,7 @@ class TestBasicReportGeneration:
     
     def test_report_with_relative_path(self, pytester):
         """Verify report can be created with relative path."""
-        pytester.makepyfile("""
-            import pytest
-            import time
-
-            @pytest.mark.vigil(timeout=2.0)
-            def test_sample():
-                time.sleep(0.1)
-        """)
+        pytester.makepyfile(SAMPLE_TEST)
         
         report_file = "reports/vigil.json"
         pytester.path.joinpath("reports").mkdir(exist_ok=True)
@@ -84,14 +83,7 @@ class TestBasicReportGeneration:
     
     def test_report_with_absolute_path(self, pytester, tmp_path):
         """Verify report can be created with absolute path."""
-        pytester.makepyfile("""
-            import pytest
-            import time
-
-            @pytest.mark.vigil(timeout=2.0)
-            def test_sample():
-                time.sleep(0.1)
-        """)
+        pytester.makepyfile(SAMPLE_TEST)
         
         report_file = tmp_path / "vigil_absolute.json"
         result = pytester.runpytest(f"--vigil-report={report_file}")
@@ -101,14 +93,7 @@ class TestBasicReportGeneration:
     
     def test_report_overwrites_existing_file(self, pytester):
         """Verify report overwrites existing file."""
-        pytester.makepyfile("""
-            import pytest
-            import time
-
-            @pytest.mark.vigil(timeout=2.0)
-            def test_sample():
-                time.sleep(0.1)
-        """)
+        pytester.makepyfile(SAMPLE_TEST)
         
         report_file = "vigil_report.json"
         report_path = pytester.path / report_file
@@ -119,22 +104,14 @@ class TestBasicReportGeneration:
         result = pytester.runpytest(f"--vigil-report={report_file}")
         
         assert result.ret == 0
-        with open(report_path) as f:
-            data = json.load(f)
+        data = json.loads(report_path.read_bytes())
         
         assert "old" not in data
         assert "results" in data
     
     def test_no_report_without_option(self, pytester):
         """Verify no report is generated without --vigil-report option."""
-        pytester.makepyfile("""
-            import pytest
-            import time
-
-            @pytest.mark.vigil(timeout=2.0)
-            def test_sample():
-                time.sleep(0.1)
-        """)
+        pytester.makepyfile(SAMPLE_TEST)
         
         result = pytester.runpytest()
         
@@ -146,244 +123,87 @@ class TestBasicReportGeneration:
 class TestTestOutcomes:
     """Test JSON report with various test outcomes."""
     
-    def test_report_passed_test(self, pytester):
-        """Verify passed test appears in report."""
+    def test_report_outcomes(self, pytester):
+        """Verify tests of every outcome are handled in a single report."""
         pytester.makepyfile("""
             import pytest
             import time
 
             @pytest.mark.vigil(timeout=2.0)
             def test_pass():
-                time.sleep(0.1)
+                time.sleep(0.001)
                 assert True
-        """)
-        
-        report_file = "vigil_report.json"
-        result = pytester.runpytest(f"--vigil-report={report_file}")
-        
-        assert result.ret == 0
-        
-        with open(pytester.path / report_file) as f:
-            data = json.load(f)
-        
-        assert len(data["results"]) == 1
-        assert "test_pass" in data["results"][0]["node_id"]
-    
-    def test_report_failed_test(self, pytester):
-        """Verify failed test appears in report."""
-        pytester.makepyfile("""
-            import pytest
-            import time
 
             @pytest.mark.vigil(timeout=2.0)
             def test_fail():
-                time.sleep(0.1)
+                time.sleep(0.001)
                 assert False, "Expected failure"
-        """)
-        
-        report_file = "vigil_report.json"
-        result = pytester.runpytest(f"--vigil-report={report_file}")
-        
-        assert result.ret == 1
-        
-        with open(pytester.path / report_file) as f:
-            data = json.load(f)
-        
-        assert len(data["results"]) == 1
-        assert "test_fail" in data["results"][0]["node_id"]
-    
-    def test_report_skipped_test(self, pytester):
-        """Verify skipped test behavior - likely not in report as vigil doesn't run."""
-        pytester.makepyfile("""
-            import pytest
-            import time
+
+            @pytest.mark.vigil(timeout=2.0)
+            def test_another_pass():
+                time.sleep(0.001)
+                assert True
 
             @pytest.mark.vigil(timeout=2.0)
             @pytest.mark.skip(reason="Skipped test")
             def test_skip():
-                time.sleep(0.1)
-        """)
-        
-        report_file = "vigil_report.json"
-        result = pytester.runpytest(f"--vigil-report={report_file}")
-        
-        # Skipped test shouldn't fail the run
-        assert result.ret == 0
-        
-        with open(pytester.path / report_file) as f:
-            data = json.load(f)
-        
-        # Skipped tests likely won't appear as vigil doesn't monitor them
-        # Just verify report is valid
-        assert "results" in data
-    
-    def test_report_xfail_test(self, pytester):
-        """Verify xfail test appears in report."""
-        pytester.makepyfile("""
-            import pytest
-            import time
+                time.sleep(0.001)
 
             @pytest.mark.vigil(timeout=2.0)
             @pytest.mark.xfail(reason="Expected to fail")
             def test_xfail():
-                time.sleep(0.1)
+                time.sleep(0.001)
                 assert False
-        """)
-        
-        report_file = "vigil_report.json"
-        result = pytester.runpytest(f"--vigil-report={report_file}")
-        
-        # xfail doesn't cause failure
-        assert result.ret == 0
-        
-        with open(pytester.path / report_file) as f:
-            data = json.load(f)
-        
-        # Test may or may not appear depending on vigil's execution
-        assert "results" in data
-    
-    def test_report_xpass_test(self, pytester):
-        """Verify xpass test appears in report."""
-        pytester.makepyfile("""
-            import pytest
-            import time
 
             @pytest.mark.vigil(timeout=2.0)
             @pytest.mark.xfail(reason="Expected to fail but passes")
             def test_xpass():
-                time.sleep(0.1)
+                time.sleep(0.001)
                 assert True
         """)
         
         report_file = "vigil_report.json"
         result = pytester.runpytest(f"--vigil-report={report_file}")
         
-        with open(pytester.path / report_file) as f:
-            data = json.load(f)
-        
-        assert "results" in data
-    
-    def test_report_mixed_outcomes(self, pytester):
-        """Verify report contains all tests with different outcomes."""
-        pytester.makepyfile("""
-            import pytest
-            import time
-
-            @pytest.mark.vigil(timeout=2.0)
-            def test_pass():
-                time.sleep(0.1)
-                assert True
-
-            @pytest.mark.vigil(timeout=2.0)
-            def test_fail():
-                time.sleep(0.1)
-                assert False, "Expected failure"
-
-            @pytest.mark.vigil(timeout=2.0)
-            def test_another_pass():
-                time.sleep(0.1)
-                assert True
-        """)
-        
-        report_file = "vigil_report.json"
-        result = pytester.runpytest(f"--vigil-report={report_file}")
-        
-        assert result.ret == 1  # One failure
+        # Only the plain failure fails the run
+        result.assert_outcomes(passed=2, failed=1, skipped=1, xfailed=1, xpassed=1)
+        assert result.ret == 1
         
-        with open(pytester.path / report_file) as f:
-            data = json.load(f)
+        data = json.loads((pytester.path / report_file).read_bytes())
         
-        assert len(data["results"]) == 3
         node_ids = [r["node_id"] for r in data["results"]]
         assert any("test_pass" in nid for nid in node_ids)
         assert any("test_fail" in nid for nid in node_ids)
         assert any("test_another_pass" in nid for nid in node_ids)
+        assert any("test_xfail" in nid for nid in node_ids)
+        assert any("test_xpass" in nid for nid in node_ids)
 
 
 class TestParameters:
     """Test JSON report with various vigil parameters."""
     
-    def test_report_timeout_parameter(self, pytester):
-        """Verify timeout parameter is recorded in limits."""
+    def test_report_marker_parameters(self, pytester):
+        """Verify timeout, memory and CPU marker parameters are recorded in limits."""
+        # One run covers each parameter alone and all of them together
         pytester.makepyfile("""
             import pytest
             import time
 
             @pytest.mark.vigil(timeout=1.5)
             def test_timeout():
-                time.sleep(0.1)
-        """)
-        
-        report_file = "vigil_report.json"
-        result = pytester.runpytest(f"--vigil-report={report_file}")
-        
-        assert result.ret == 0
-        
-        with open(pytester.path / report_file) as f:
-            data = json.load(f)
-        
-        limits = data["results"][0]["limits"]
-        timeout_limits = [l for l in limits if l.get("limit_type") == "time"]
-        assert len(timeout_limits) > 0
-        assert timeout_limits[0]["threshold"] == 1.5
-    
-    def test_report_memory_parameter(self, pytester):
-        """Verify memory parameter is recorded in limits."""
-        pytester.makepyfile("""
-            import pytest
-            import time
+                time.sleep(0.001)
 
             @pytest.mark.vigil(memory=100)
             def test_memory():
-                time.sleep(0.1)
-        """)
-        
-        report_file = "vigil_report.json"
-        result = pytester.runpytest(f"--vigil-report={report_file}")
-        
-        assert result.ret == 0
-        
-        with open(pytester.path / report_file) as f:
-            data = json.load(f)
-        
-        limits = data["results"][0]["limits"]
-        memory_limits = [l for l in limits if l.get("limit_type") == "memory"]
-        assert len(memory_limits) > 0
-        assert memory_limits[0]["threshold"] == 100
-    
-    def test_report_cpu_parameter(self, pytester):
-        """Verify CPU parameter is recorded in limits."""
-        pytester.makepyfile("""
-            import pytest
-            import time
+                time.sleep(0.001)
 
             @pytest.mark.vigil(cpu=200)
             def test_cpu():
-                time.sleep(0.1)
-        """)
-        
-        report_file = "vigil_report.json"
-        result = pytester.runpytest(f"--vigil-report={report_file}")
-        
-        assert result.ret == 0
-        
-        with open(pytester.path / report_file) as f:
-            data = json.load(f)
-        
-        limits = data["results"][0]["limits"]
-        cpu_limits = [l for l in limits if l.get("limit_type") == "cpu"]
-        assert len(cpu_limits) > 0
-        assert cpu_limits[0]["threshold"] == 200
-    
-    def test_report_all_parameters(self, pytester):
-        """Verify all parameters are recorded correctly."""
-        pytester.makepyfile("""
-            import pytest
-            import time
+                time.sleep(0.001)
 
             @pytest.mark.vigil(timeout=2.0, memory=100, cpu=200)
             def test_all_params():
-                time.sleep(0.1)
+                time.sleep(0.001)
         """)
         
         report_file = "vigil_report.json"
@@ -391,11 +211,19 @@ class TestParameters:
         
         assert result.ret == 0
         
-        with open(pytester.path / report_file) as f:
-            data = json.load(f)
+        data = json.loads((pytester.path / report_file).read_bytes())
         
-        limits = data["results"][0]["limits"]
-        limit_types = {l["limit_type"] for l in limits}
+        limits = {r["node_id"].rsplit("::", 1)[-1]: r["limits"] for r in data["results"]}
+        for name, limit_type, threshold in (
+            ("test_timeout", "time", 1.5),
+            ("test_memory", "memory", 100),
+            ("test_cpu", "cpu", 200),
+        ):
+            matching = [l for l in limits[name] if l.get("limit_type") == limit_type]
+            assert len(matching) > 0
+            assert matching[0]["threshold"] == threshold
+        
+        limit_types = {l["limit_type"] for l in limits["test_all_params"]}
         
         assert "time" in limit_types
         assert "memory" in limit_types
@@ -408,7 +236,7 @@ class TestParameters:
             import time
 
             def test_cli_params():
-                time.sleep(0.1)
+                time.sleep(0.001)
         """)
         
         report_file = "vigil_report.json"
@@ -425,12 +253,29 @@ class TestParameters:
         report_path = pytester.path / report_file
         assert report_path.exists()
         
-        with open(report_path) as f:
-            data = json.load(f)
+        data = json.loads(report_path.read_bytes())
         
         assert "results" in data
         assert len(data["results"]) > 0
 
+    def test_report_samples_time_only_tests_at_base_interval(self, pytester):
+        """Verify a far time limit does not thin out the samples behind the report."""
+        pytester.makepyfile("""
+            import time
+
+            def test_busy():
+                end = time.monotonic() + 0.6
+                while time.monotonic() < end:
+                    pass
+        """)
+
+        report_file = "vigil_report.json"
+        result = pytester.runpytest("--vigil-timeout=30", f"--vigil-report={report_file}")
+
+        assert result.ret == 0
+        data = json.loads((pytester.path / report_file).read_bytes())
+        assert data["results"][0]["max_cpu"] > 0
+
 
 class TestRetryMechanism:
     """Test JSON report with retry mechanism."""
@@ -457,8 +302,7 @@ class TestRetryMechanism:
         
         assert result.ret == 0
         
-        with open(pytester.path / report_file) as f:
-            data = json.load(f)
+        data = json.loads((pytester.path / report_file).read_bytes())
         
         # Should have multiple attempts for the flaky test
         test_results = [r for r in data["results"] if "test_flaky" in r["node_id"]]
@@ -491,8 +335,7 @@ class TestRetryMechanism:
         
         assert result.ret == 0
         
-        with open(pytester.path / report_file) as f:
-            data = json.load(f)
+        data = json.loads((pytester.path / report_file).read_bytes())
         
         assert len(data["flaky_tests"]) > 0
         assert any("test_flaky" in nodeid for nodeid in data["flaky_tests"])
@@ -505,7 +348,7 @@ class TestRetryMechanism:
 
             @pytest.mark.vigil(timeout=2.0, retry=2)
             def test_stable():
-                time.sleep(0.1)
+                time.sleep(0.001)
                 assert True
         """)
         
@@ -514,8 +357,7 @@ class TestRetryMechanism:
         
         assert result.ret == 0
         
-        with open(pytester.path / report_file) as f:
-            data = json.load(f)
+        data = json.loads((pytester.path / report_file).read_bytes())
         
         assert len(data["flaky_tests"]) == 0
 
@@ -531,7 +373,7 @@ class TestCIEnvironment:
 
             @pytest.mark.vigil(timeout=1.0)
             def test_ci():
-                time.sleep(0.1)
+                time.sleep(0.001)
         """)
         
         report_file = "vigil_report.json"
@@ -543,8 +385,7 @@ class TestCIEnvironment:
         
         assert result.ret == 0
         
-        with open(pytester.path / report_file) as f:
-            data = json.load(f)
+        data = json.loads((pytester.path / report_file).read_bytes())
         
         limits = data["results"][0]["limits"]
         timeout_limits = [l for l in limits if l.get("limit_type") == "time"]
@@ -560,7 +401,7 @@ class TestCIEnvironment:
 
             @pytest.mark.vigil(timeout=1.0)
             def test_no_ci():
-                time.sleep(0.1)
+                time.sleep(0.001)
         """)
         
         report_file = "vigil_report.json"
@@ -572,8 +413,7 @@ class TestCIEnvironment:
         
         assert result.ret == 0
         
-        with open(pytester.path / report_file) as f:
-            data = json.load(f)
+        data = json.loads((pytester.path / report_file).read_bytes())
         
         limits = data["results"][0]["limits"]
         timeout_limits = [l for l in limits if l.get("limit_type") == "time"]
@@ -593,19 +433,19 @@ class TestXDistIntegration:
 
             @pytest.mark.vigil(timeout=5.0)
             def test_worker_1():
-                time.sleep(0.1)
+                time.sleep(0.001)
 
             @pytest.mark.vigil(timeout=5.0)
             def test_worker_2():
-                time.sleep(0.1)
+                time.sleep(0.001)
 
             @pytest.mark.vigil(timeout=5.0)
             def test_worker_3():
-                time.sleep(0.1)
+                time.sleep(0.001)
 
             @pytest.mark.vigil(timeout=5.0)
             def test_worker_4():
-                time.sleep(0.1)
+                time.sleep(0.001)
         """)
         
         report_file = "vigil_xdist.json"
@@ -616,8 +456,7 @@ class TestXDistIntegration:
         report_path = pytester.path / report_file
         assert report_path.exists(), "Report file was not created"
         
-        with open(report_path) as f:
-            data = json.load(f)
+        data = json.loads(report_path.read_bytes())
         
         # All 4 tests should be in the report
         assert len(data["results"]) == 4
@@ -636,16 +475,16 @@ class TestXDistIntegration:
 
             @pytest.mark.vigil(timeout=5.0)
             def test_pass_1():
-                time.sleep(0.1)
+                time.sleep(0.001)
 
             @pytest.mark.vigil(timeout=5.0)
             def test_fail():
-                time.sleep(0.1)
+                time.sleep(0.001)
                 assert False, "Expected failure"
 
             @pytest.mark.vigil(timeout=5.0)
             def test_pass_2():
-                time.sleep(0.1)
+                time.sleep(0.001)
         """)
         
         report_file = "vigil_xdist.json"
@@ -653,8 +492,7 @@ class TestXDistIntegration:
         
         assert result.ret == 1  # One failure
         
-        with open(pytester.path / report_file) as f:
-            data = json.load(f)
+        data = json.loads((pytester.path / report_file).read_bytes())
         
         assert len(data["results"]) == 3
     
@@ -680,8 +518,7 @@ class TestXDistIntegration:
         
         assert result.ret == 0
         
-        with open(pytester.path / report_file) as f:
-            data = json.load(f)
+        data = json.loads((pytester.path / report_file).read_bytes())
         
         # Should have flaky test recorded
         assert len(data["flaky_tests"]) > 0
@@ -704,8 +541,7 @@ class TestEdgeCases:
         report_path = pytester.path / report_file
         if report_path.exists():
             # If report exists, it should be empty
-            with open(report_path) as f:
-                data = json.load(f)
+            data = json.loads(report_path.read_bytes())
             assert data["results"] == []
             assert data["flaky_tests"] == []
     
@@ -716,7 +552,7 @@ class TestEdgeCases:
             import time
 
             def test_no_marker():
-                time.sleep(0.1)
+                time.sleep(0.001)
                 assert True
         """)
         
@@ -728,8 +564,7 @@ class TestEdgeCases:
         report_path = pytester.path / report_file
         # Tests without vigil marker won't generate report
         if report_path.exists():
-            with open(report_path) as f:
-                data = json.load(f)
+            data = json.loads(report_path.read_bytes())
             assert "results" in data
     
     def test_report_mixed_vigil_and_non_vigil(self, pytester):
@@ -740,15 +575,15 @@ class TestEdgeCases:
 
             @pytest.mark.vigil(timeout=2.0)
             def test_with_vigil():
-                time.sleep(0.1)
+                time.sleep(0.001)
 
             def test_without_vigil():
-                time.sleep(0.1)
+                time.sleep(0.001)
                 assert True
 
             @pytest.mark.vigil(timeout=2.0)
             def test_another_vigil():
-                time.sleep(0.1)
+                time.sleep(0.001)
         """)
         
         report_file = "vigil_report.json"
@@ -756,8 +591,7 @@ class TestEdgeCases:
         
         assert result.ret == 0
         
-        with open(pytester.path / report_file) as f:
-            data = json.load(f)
+        data = json.loads((pytester.path / report_file).read_bytes())
         
         # Should have at least the vigil-marked tests
         vigil_tests = [r for r in data["results"] if "vigil" in r["node_id"]]
@@ -772,15 +606,15 @@ class TestEdgeCases:
             @pytest.mark.vigil(timeout=2.0)
             class TestClass:
                 def test_one(self):
-                    time.sleep(0.1)
+                    time.sleep(0.001)
                 
                 def test_two(self):
-                    time.sleep(0.1)
+                    time.sleep(0.001)
             
             @pytest.mark.vigil(timeout=2.0)
             class TestAnotherClass:
                 def test_three(self):
-                    time.sleep(0.1)
+                    time.sleep(0.001)
         """)
         
         report_file = "vigil_report.json"
@@ -788,8 +622,7 @@ class TestEdgeCases:
         
         assert result.ret == 0
         
-        with open(pytester.path / report_file) as f:
-            data = json.load(f)
+        data = json.loads((pytester.path / report_file).read_bytes())
         
         assert len(data["results"]) == 3
     
@@ -801,7 +634,7 @@ class TestEdgeCases:
 
             @pytest.mark.vigil(timeout=2.0)
             def test_in_file1():
-                time.sleep(0.1)
+                time.sleep(0.001)
         """)
         
         pytester.makepyfile(test_file2="""
@@ -810,7 +643,7 @@ class TestEdgeCases:
 
             @pytest.mark.vigil(timeout=2.0)
             def test_in_file2():
-                time.sleep(0.1)
+                time.sleep(0.001)
         """)
         
         report_file = "vigil_report.json"
@@ -818,8 +651,7 @@ class TestEdgeCases:
         
         assert result.ret == 0
         
-        with open(pytester.path / report_file) as f:
-            data = json.load(f)
+        data = json.loads((pytester.path / report_file).read_bytes())
         
         assert len(data["results"]) == 2
         nodeids = [r["node_id"] for r in data["results"]]
@@ -842,8 +674,7 @@ class TestEdgeCases:
         
         assert result.ret == 0
         
-        with open(pytester.path / report_file) as f:
-            data = json.load(f)
+        data = json.loads((pytester.path / report_file).read_bytes())
         
         # Should handle tests with minimal measurements
         assert len(data["results"]) == 1
@@ -862,7 +693,7 @@ class TestFeatureNonInterference:
 
             @pytest.mark.vigil(timeout=2.0)
             def test_with_session_timeout():
-                time.sleep(0.1)
+                time.sleep(0.001)
         """)
         
         report_file = "vigil_report.json"
@@ -873,8 +704,7 @@ class TestFeatureNonInterference:
         
         assert result.ret == 0
         
-        with open(pytester.path / report_file) as f:
-            data = json.load(f)
+        data = json.loads((pytester.path / report_file).read_bytes())
         
         assert len(data["results"]) == 1
     
@@ -886,7 +716,7 @@ class TestFeatureNonInterference:
 
             @pytest.mark.vigil(timeout=2.0)
             def test_fail_preserve_exit():
-                time.sleep(0.1)
+                time.sleep(0.001)
                 assert False, "Expected failure"
         """)
         
@@ -907,7 +737,7 @@ class TestFeatureNonInterference:
 
             @pytest.mark.vigil(timeout=2.0)
             def test_verbose():
-                time.sleep(0.1)
+                time.sleep(0.001)
         """)
         
         report_file = "vigil_report.json"
@@ -922,22 +752,14 @@ class TestCPUBreakdownInJSON:
     
     def test_cpu_breakdown_field_exists(self, pytester):
         """Verify cpu_breakdown field is present in JSON report."""
-        pytester.makepyfile("""
-            import pytest
-            import time
-
-            @pytest.mark.vigil(timeout=2.0)
-            def test_sample():
-                time.sleep(0.1)
-        """)
+        pytester.makepyfile(SAMPLE_TEST)
         
         report_file = "vigil_report.json"
         result = pytester.runpytest(f"--vigil-report={report_file}")
         
         assert result.ret == 0
         
-        with open(pytester.path / report_file) as f:
-            data = json.load(f)
+        data = json.loads((pytester.path / report_file).read_bytes())
         
         assert len(data["results"]) > 0
         result_entry = data["results"][0]
@@ -948,22 +770,14 @@ class TestCPUBreakdownInJSON:
     
     def test_cpu_breakdown_contains_pytest_process(self, pytester):
         """Verify cpu_breakdown contains at least pytest process."""
-        pytester.makepyfile("""
-            import pytest
-            import time
-
-            @pytest.mark.vigil(timeout=2.0)
-            def test_sample():
-                time.sleep(0.1)
-        """)
+        pytester.makepyfile(SAMPLE_TEST)
         
         report_file = "vigil_report.json"
         result = pytester.runpytest(f"--vigil-report={report_file}")
         
         assert result.ret == 0
         
-        with open(pytester.path / report_file) as f:
-            data = json.load(f)
+        data = json.loads((pytester.path / report_file).read_bytes())
         
         cpu_breakdown = data["results"][0]["cpu_breakdown"]
         
@@ -988,7 +802,7 @@ class TestCPUBreakdownInJSON:
                     stderr=subprocess.PIPE
                 )
                 proc.wait()
-                time.sleep(0.1)
+                time.sleep(0.001)
         """)
         
         report_file = "vigil_subprocess.json"
@@ -996,8 +810,7 @@ class TestCPUBreakdownInJSON:
         
         assert result.ret == 0
         
-        with open(pytester.path / report_file) as f:
-            data = json.load(f)
+        data = json.loads((pytester.path / report_file).read_bytes())
         
         cpu_breakdown = data["results"][0]["cpu_breakdown"]
         
@@ -1014,7 +827,7 @@ class TestCPUBreakdownInJSON:
 
             @pytest.mark.vigil(timeout=2.0)
             def test_process_types():
-                time.sleep(0.1)
+                time.sleep(0.001)
         """)
         
         report_file = "vigil_report.json"
@@ -1022,8 +835,7 @@ class TestCPUBreakdownInJSON:
         
         assert result.ret == 0
         
-        with open(pytester.path / report_file) as f:
-            data = json.load(f)
+        data = json.loads((pytester.path / report_file).read_bytes())
         
         cpu_breakdown = data["results"][0]["cpu_breakdown"]
         
@@ -1057,8 +869,7 @@ class TestCPUBreakdownInJSON:
         
         assert result.ret == 0
         
-        with open(pytester.path / report_file) as f:
-            data = json.load(f)
+        data = json.loads((pytester.path / report_file).read_bytes())
         
         # All tests should have cpu_breakdown
         assert len(data["results"]) == 3
@@ -1075,19 +886,19 @@ class TestCPUBreakdownInJSON:
 
             @pytest.mark.vigil(timeout=2.0)
             def test_xdist_1():
-                time.sleep(0.1)
+                time.sleep(0.001)
             
             @pytest.mark.vigil(timeout=2.0)
             def test_xdist_2():
-                time.sleep(0.1)
+                time.sleep(0.001)
             
             @pytest.mark.vigil(timeout=2.0)
             def test_xdist_3():
-                time.sleep(0.1)
+                time.sleep(0.001)
             
             @pytest.mark.vigil(timeout=2.0)
             def test_xdist_4():
-                time.sleep(0.1)
+                time.sleep(0.001)
         """)
         
         report_file = "vigil_xdist_breakdown.json"
@@ -1095,8 +906,7 @@ class TestCPUBreakdownInJSON:
         
         assert result.ret == 0
         
-        with open(pytester.path / report_file) as f:
-            data = json.load(f)
+        data = json.loads((pytester.path / report_file).read_bytes())
         
         # All 4 tests should have cpu_breakdown
         assert len(data["results"]) == 4
@@ -1112,7 +922,7 @@ class TestCPUBreakdownInJSON:
 
             @pytest.mark.vigil(timeout=2.0)
             def test_fail():
-                time.sleep(0.1)
+                time.sleep(0.001)
                 assert False, "Expected failure"
         """)
         
@@ -1121,8 +931,7 @@ class TestCPUBreakdownInJSON:
         
         assert result.ret == 1
         
-        with open(pytester.path / report_file) as f:
-            data = json.load(f)
+        data = json.loads((pytester.path / report_file).read_bytes())
         
         # Failed test should still have cpu_breakdown
         assert len(data["results"]) == 1
@@ -1151,8 +960,7 @@ class TestCPUBreakdownInJSON:
         
         assert result.ret == 0
         
-        with open(pytester.path / report_file) as f:
-            data = json.load(f)
+        data = json.loads((pytester.path / report_file).read_bytes())
         
         # Multiple attempts should each have cpu_breakdown
         test_results = [r for r in data["results"] if "test_retry" in r["node_id"]]
@@ -1164,22 +972,14 @@ class TestCPUBreakdownInJSON:
     
     def test_cpu_breakdown_total_matches_max_cpu(self, pytester):
         """Verify max_cpu value matches sum of cpu_breakdown values."""
-        pytester.makepyfile("""
-            import pytest
-            import time
-
-            @pytest.mark.vigil(timeout=2.0)
-            def test_sample():
-                time.sleep(0.1)
-        """)
+        pytester.makepyfile(SAMPLE_TEST)
         
         report_file = "vigil_report.json"
         result = pytester.runpytest(f"--vigil-report={report_file}")
         
         assert result.ret == 0
         
-        with open(pytester.path / report_file) as f:
-            data = json.load(f)
+        data = json.loads((pytester.path / report_file).read_bytes())
         
         result_entry = data["results"][0]
         max_cpu = result_entry["max_cpu"]
@@ -1209,8 +1009,7 @@ class TestCPUBreakdownInJSON:
         
         assert result.ret == 0
         
-        with open(pytester.path / report_file) as f:
-            data = json.load(f)
+        data = json.loads((pytester.path / report_file).read_bytes())
         
         # Should have cpu_breakdown field even if minimal measurements
         assert "cpu_breakdown" in data["results"][0]
@@ -1218,14 +1017,7 @@ class TestCPUBreakdownInJSON:
     
     def test_cpu_breakdown_json_serializable(self, pytester):
         """Verify cpu_breakdown values are JSON serializable."""
-        pytester.makepyfile("""
-            import pytest
-            import time
-
-            @pytest.mark.vigil(timeout=2.0)
-            def test_sample():
-                time.sleep(0.1)
-        """)
+        pytester.makepyfile(SAMPLE_TEST)
         
         report_file = "vigil_report.json"
         result = pytester.runpytest(f"--vigil-report={report_file}")
@@ -1233,8 +1025,7 @@ class TestCPUBreakdownInJSON:
         assert result.ret == 0
         
         # If we can load it as JSON, all values are serializable
-        with open(pytester.path / report_file) as f:
-            data = json.load(f)
+        data = json.loads((pytester.path / report_file).read_bytes())
         
         # Verify we can serialize again (round-trip test)
         json_str = json.dumps(data)
@@ -1244,22 +1035,14 @@ class TestCPUBreakdownInJSON:
     
     def test_cpu_breakdown_preserves_structure(self, pytester):
         """Verify cpu_breakdown preserves expected JSON structure."""
-        pytester.makepyfile("""
-            import pytest
-            import time
-
-            @pytest.mark.vigil(timeout=2.0)
-            def test_sample():
-                time.sleep(0.1)
-        """)
+        pytester.makepyfile(SAMPLE_TEST)
         
         report_file = "vigil_report.json"
         result = pytester.runpytest(f"--vigil-report={report_file}")
         
         assert result.ret == 0
         
-        with open(pytester.path / report_file) as f:
-            data = json.load(f)
+        data = json.loads((pytester.path / report_file).read_bytes())
         
         result_entry = data["results"][0]
         
@@ -1274,3 +1057,26 @@ class TestCPUBreakdownInJSON:
         
         # Verify cpu_breakdown is at the same level as other metrics
         assert isinstance(result_entry["cpu_breakdown"], dict)
+    
+    def test_cpu_breakdown_disabled_by_env(self, pytester, monkeypatch):
+        """Verify PYTEST_VIGIL__CPU_BREAKDOWN_EVERY=0 skips the breakdown but keeps measurements."""
+        monkeypatch.setenv("PYTEST_VIGIL__CPU_BREAKDOWN_EVERY", "0")
+        pytester.makepyfile("""
+            import pytest
+            import time
+
+            @pytest.mark.vigil(timeout=2.0)
+            def test_sample():
+                time.sleep(0.3)
+        """)
+        
+        report_file = "vigil_report.json"
+        result = pytester.runpytest(f"--vigil-report={report_file}")
+        
+        assert result.ret == 0
+        
+        data = json.loads((pytester.path / report_file).read_bytes())
+        
+        result_entry = data["results"][0]
+        assert result_entry["cpu_breakdown"] == {}
+        assert result_entry["max_memory"] > 0
@@ -21,6 +21,11 @@ import os
 pytest_plugins = ["pytester"]
 
 
+def _full_output(result):
+    """Returns stdout and stderr of a pytester run as one string, joined once."""
+    return "\n".join(result.outlines + result.errlines)
+
+
 # =============================================================================
 # 1. BASIC FUNCTIONALITY TESTS
 # =============================================================================
@@ -39,7 +44,7 @@ class TestBasicResourceLimits:
                 time.sleep(1)
         """)
         result = pytester.runpytest()
-        result.stdout.fnmatch_lines(["*Test timed out (Vigil)*"])
+        assert "Test timed out (Vigil)" in result.stdout.str()
         assert result.ret == 1
 
     def test_timeout_passing(self, pytester):
@@ -69,9 +74,7 @@ class TestBasicResourceLimits:
                 time.sleep(1)  # Allow monitor to catch it
         """)
         result = pytester.runpytest()
-        stdout_str = result.stdout.str()
-        stderr_str = result.stderr.str()
-        full_output = stdout_str + stderr_str
+        full_output = _full_output(result)
         
         assert "TimeoutException: Test timed out (Vigil)" in full_output
         assert "Policy violation" in full_output
@@ -102,12 +105,10 @@ class TestBasicResourceLimits:
             def test_cpu():
                 end = time.time() + 2
                 while time.time() < end:
-                    _ = [i*i for i in range(1000)]
+                    pass
         """)
         result = pytester.runpytest()
-        stdout_str = result.stdout.str()
-        stderr_str = result.stderr.str()
-        full_output = stdout_str + stderr_str
+        full_output = _full_output(result)
         
         assert "TimeoutException: Test timed out (Vigil)" in full_output
         assert "Policy violation" in full_output
@@ -155,7 +156,7 @@ class TestBasicResourceLimits:
                 time.sleep(2)
         """)
         result = pytester.runpytest()
-        result.stdout.fnmatch_lines(["*Test timed out (Vigil)*"])
+        assert "Test timed out (Vigil)" in result.stdout.str()
         assert result.ret == 1
 
 
@@ -286,7 +287,7 @@ class TestResourceLimitsCLI:
                 time.sleep(1.5)
         """)
         result = pytester.runpytest("--vigil-timeout=0.5")
-        result.stdout.fnmatch_lines(["*Test timed out (Vigil)*"])
+        assert "Test timed out (Vigil)" in result.stdout.str()
         assert result.ret == 1
 
     def test_cli_timeout_passing(self, pytester):
@@ -301,6 +302,49 @@ class TestResourceLimitsCLI:
         result = pytester.runpytest("--vigil-timeout=1.0")
         assert result.ret == 0
 
+    def test_cli_timeout_after_nested_run(self, pytester):
+        """Verify a nested in-process pytest run leaves the enclosing test's timeout armed."""
+        pytester.makepyfile("""
+            import time
+
+            pytest_plugins = "pytester"
+
+            def test_nested_then_slow(pytester):
+                pytester.makepyfile("def test_inner(): pass")
+                pytester.runpytest_inprocess("-p", "no:cacheprovider").assert_outcomes(passed=1)
+                time.sleep(3)
+        """)
+        result = pytester.runpytest("--vigil-timeout=1.5")
+        assert "Test timed out (Vigil)" in result.stdout.str()
+        assert result.ret == 1
+
+    def test_session_off_main_thread(self, pytester):
+        """Verify a session run from a worker thread, where no signal handler can be installed, still runs."""
+        pytester.makepyfile(test_threaded="""
+            import pytest
+
+            def test_plain():
+                pass
+
+            @pytest.mark.vigil(timeout=5.0)
+            def test_marked():
+                pass
+        """)
+        script = pytester.makepyfile(run_threaded="""
+            import threading
+            import pytest
+
+            exit_codes = []
+            worker = threading.Thread(
+                target=lambda: exit_codes.append(pytest.main(["test_threaded.py", "-p", "no:cacheprovider"]))
+            )
+            worker.start()
+            worker.join()
+            print("exit code:", int(exit_codes[0]))
+        """)
+        result = pytester.runpython(script)
+        result.stdout.fnmatch_lines(["exit code: 0"])
+
     def test_cli_memory_option(self, pytester):
         """Verify --vigil-memory CLI option works."""
         pytester.makepyfile("""
@@ -311,7 +355,7 @@ class TestResourceLimitsCLI:
                 time.sleep(1)
         """)
         result = pytester.runpytest("--vigil-memory=10")
-        full_output = result.stdout.str() + result.stderr.str()
+        full_output = _full_output(result)
         assert "Policy violation" in full_output
         assert result.ret == 1
 
@@ -323,10 +367,10 @@ class TestResourceLimitsCLI:
             def test_cli_cpu():
                 end = time.time() + 2
                 while time.time() < end:
-                    _ = [i*i for i in range(1000)]
+                    pass
         """)
         result = pytester.runpytest("--vigil-cpu=1")
-        full_output = result.stdout.str() + result.stderr.str()
+        full_output = _full_output(result)
         assert "Policy violation" in full_output
         assert result.ret == 1
 
@@ -351,7 +395,35 @@ class TestResourceLimitsCLI:
                 time.sleep(2)
         """)
         result = pytester.runpytest("--vigil-timeout=0.5", "--vigil-memory=150")
-        result.stdout.fnmatch_lines(["*Test timed out (Vigil)*"])
+        assert "Test timed out (Vigil)" in result.stdout.str()
+        assert result.ret == 1
+
+    def test_cli_monitor_interval_option(self, pytester):
+        """Verify a custom sampling interval still catches CPU violations."""
+        pytester.makepyfile("""
+            import time
+
+            def test_cli_interval():
+                end = time.time() + 1.0
+                while time.time() < end:
+                    pass
+        """)
+        result = pytester.runpytest("--vigil-cpu=0.1", "--vigil-monitor-interval=0.2")
+        assert "Policy violation" in _full_output(result)
+        assert result.ret == 1
+
+    def test_cli_monitor_adaptive_keeps_stall_detection(self, pytester):
+        """Verify adaptive sampling still detects a stall once the interval has widened."""
+        pytester.makepyfile("""
+            import time
+
+            def test_cli_adaptive_stall():
+                time.sleep(3)
+        """)
+        result = pytester.runpytest(
+            "--vigil-monitor-adaptive", "--vigil-stall-timeout=1.5", "--vigil-stall-cpu-threshold=100"
+        )
+        assert "Policy violation" in _full_output(result)
         assert result.ret == 1
 
 
@@ -399,7 +471,7 @@ class TestResourceLimitsPrecedence:
                 time.sleep(1.0)
         """)
         result = pytester.runpytest("--vigil-timeout=0.5")
-        result.stdout.fnmatch_lines(["*Test timed out (Vigil)*"])
+        assert "Test timed out (Vigil)" in result.stdout.str()
         assert result.ret == 1
 
     def test_env_var_default(self, pytester, monkeypatch):
@@ -412,7 +484,7 @@ class TestResourceLimitsPrecedence:
                 time.sleep(1.0)
         """)
         result = pytester.runpytest()
-        result.stdout.fnmatch_lines(["*Test timed out (Vigil)*"])
+        assert "Test timed out (Vigil)" in result.stdout.str()
         assert result.ret == 1
 
     def test_function_marker_overrides_class(self, pytester):
@@ -452,6 +524,26 @@ class TestResourceLimitsPrecedence:
         result = pytester.runpytest("--vigil-memory=200")
         assert result.ret == 0
 
+    def test_marker_added_by_late_hook(self, pytester):
+        """Verify a marker added by another plugin's late collection hook is enforced."""
+        pytester.makeconftest("""
+            import pytest
+
+            @pytest.hookimpl(trylast=True)
+            def pytest_collection_modifyitems(items):
+                for item in items:
+                    item.add_marker(pytest.mark.vigil(timeout=0.3))
+        """)
+        pytester.makepyfile("""
+            import time
+
+            def test_added_marker():
+                time.sleep(2)
+        """)
+        result = pytester.runpytest()
+        assert "Test timed out (Vigil)" in result.stdout.str()
+        assert result.ret == 1
+
 
 # =============================================================================
 # 5. CI ENVIRONMENT TESTS
@@ -488,7 +580,7 @@ class TestResourceLimitsCI:
         with pytest.MonkeyPatch.context() as m:
             m.setenv("CI", "false")
             result = pytester.runpytest()
-            result.stdout.fnmatch_lines(["*Test timed out (Vigil)*"])
+            assert "Test timed out (Vigil)" in result.stdout.str()
             assert result.ret == 1
 
     def test_github_actions_detection(self, pytester):
@@ -506,6 +598,38 @@ class TestResourceLimitsCI:
             result = pytester.runpytest()
             assert result.ret == 0
 
+    def test_cli_forces_ci_multiplier(self, pytester):
+        """Verify --vigil-ci applies the multiplier outside CI."""
+        pytester.makepyfile("""
+            import pytest
+            import time
+
+            @pytest.mark.vigil(timeout=0.5)
+            def test_forced_ci():
+                time.sleep(0.8)
+        """)
+        with pytest.MonkeyPatch.context() as m:
+            m.setenv("CI", "false")
+            m.delenv("GITHUB_ACTIONS", raising=False)
+            result = pytester.runpytest("--vigil-ci")
+            assert result.ret == 0
+
+    def test_cli_disables_ci_multiplier(self, pytester):
+        """Verify --no-vigil-ci skips the multiplier in CI."""
+        pytester.makepyfile("""
+            import pytest
+            import time
+
+            @pytest.mark.vigil(timeout=0.5)
+            def test_no_forced_ci():
+                time.sleep(0.8)
+        """)
+        with pytest.MonkeyPatch.context() as m:
+            m.setenv("CI", "true")
+            result = pytester.runpytest("--no-vigil-ci")
+            assert "Test timed out (Vigil)" in result.stdout.str()
+            assert result.ret == 1
+
     def test_ci_multiplier_memory(self, pytester):
         """Verify CI multiplier concept with memory (no direct multiplier but test compatibility)."""
         pytester.makepyfile("""
@@ -564,7 +688,7 @@ class TestResourceLimitsXdist:
         """)
         result = pytester.runpytest("-n", "2", "-v")
         # Check that at least one failed and one passed
-        full_output = result.stdout.str() + result.stderr.str()
+        full_output = _full_output(result)
         assert "TimeoutException: Test timed out (Vigil)" in full_output
         assert "test_pass_worker" in full_output
         assert result.ret == 1
@@ -586,7 +710,7 @@ class TestResourceLimitsXdist:
                 time.sleep(0.2)
         """)
         result = pytester.runpytest("-n", "2", "-v")
-        full_output = result.stdout.str() + result.stderr.str()
+        full_output = _full_output(result)
         assert "Policy violation" in full_output
         assert result.ret == 1
 
@@ -600,14 +724,14 @@ class TestResourceLimitsXdist:
             def test_cpu_worker():
                 end = time.time() + 2
                 while time.time() < end:
-                    _ = [i*i for i in range(1000)]
+                    pass
 
             @pytest.mark.vigil(cpu=200)
             def test_pass_cpu_worker():
                 time.sleep(0.2)
         """)
         result = pytester.runpytest("-n", "2", "-v")
-        full_output = result.stdout.str() + result.stderr.str()
+        full_output = _full_output(result)
         assert "Policy violation" in full_output
         assert result.ret == 1
 
@@ -633,7 +757,8 @@ class TestResourceLimitsXdist:
             def test_w4():
                 time.sleep(0.1)
         """)
-        result = pytester.runpytest("-n", "2", "-v")
+        # One file, so loadfile sends every test to a single worker
+        result = pytester.runpytest("-n", "2", "--dist=loadfile", "-v")
         result.assert_outcomes(passed=4)
 
     def test_xdist_worker_isolation(self, pytester):
@@ -644,12 +769,12 @@ class TestResourceLimitsXdist:
 
             @pytest.mark.vigil(timeout=1.0)
             def test_worker_a():
-                time.sleep(0.2)
+                time.sleep(0.1)
                 assert True
 
             @pytest.mark.vigil(timeout=1.0)
             def test_worker_b():
-                time.sleep(0.2)
+                time.sleep(0.1)
                 assert True
         """)
         result = pytester.runpytest("-n", "2")
@@ -674,7 +799,7 @@ class TestResourceLimitsEdgeCases:
                 time.sleep(0.1)
         """)
         result = pytester.runpytest()
-        full_output = result.stdout.str() + result.stderr.str()
+        full_output = _full_output(result)
         assert "TimeoutException: Test timed out (Vigil)" in full_output
         assert "Policy violation" in full_output
         assert result.ret == 1
@@ -691,7 +816,7 @@ class TestResourceLimitsEdgeCases:
                 time.sleep(0.5)
         """)
         result = pytester.runpytest()
-        full_output = result.stdout.str() + result.stderr.str()
+        full_output = _full_output(result)
         assert "Policy violation" in full_output
         assert result.ret == 1
 
@@ -707,7 +832,7 @@ class TestResourceLimitsEdgeCases:
                 time.sleep(0.5)
         """)
         result = pytester.runpytest()
-        full_output = result.stdout.str() + result.stderr.str()
+        full_output = _full_output(result)
         assert "Policy violation" in full_output
         assert result.ret == 1
 
@@ -751,7 +876,7 @@ class TestResourceLimitsEdgeCases:
                 time.sleep(0.5)
         """)
         result = pytester.runpytest()
-        result.stdout.fnmatch_lines(["*Test timed out (Vigil)*"])
+        assert "Test timed out (Vigil)" in result.stdout.str()
         assert result.ret == 1
 
     def test_float_memory(self, pytester):
@@ -766,7 +891,7 @@ class TestResourceLimitsEdgeCases:
                 time.sleep(0.5)
         """)
         result = pytester.runpytest()
-        full_output = result.stdout.str() + result.stderr.str()
+        full_output = _full_output(result)
         # Memory violation triggers timeout exception
         assert "Test timed out (Vigil)" in full_output or "Policy violation" in full_output
         assert result.ret == 1
@@ -787,7 +912,7 @@ class TestResourceLimitsEdgeCases:
                 pass
         """)
         result = pytester.runpytest()
-        full_output = result.stdout.str() + result.stderr.str()
+        full_output = _full_output(result)
         assert "TimeoutException: Test timed out (Vigil)" in full_output
         assert result.ret == 1
 
@@ -805,7 +930,7 @@ class TestResourceLimitsEdgeCases:
                     pass
         """)
         result = pytester.runpytest()
-        full_output = result.stdout.str() + result.stderr.str()
+        full_output = _full_output(result)
         assert "TimeoutException: Test timed out (Vigil)" in full_output
         assert result.ret == 1
 
@@ -859,7 +984,7 @@ class TestResourceLimitsEdgeCases:
                 time.sleep(0.1)
         """)
         result = pytester.runpytest()
-        full_output = result.stdout.str() + result.stderr.str()
+        full_output = _full_output(result)
         assert "TimeoutException: Test timed out (Vigil)" in full_output
         assert result.ret == 1
 
@@ -897,8 +1022,42 @@ class TestResourceLimitsInteractions:
                 time.sleep(1.5)  # Stall should trigger first
         """)
         result = pytester.runpytest()
-        full_output = result.stdout.str() + result.stderr.str()
+        full_output = _full_output(result)
+        assert "Policy violation" in full_output
+        assert result.ret == 1
+
+
+    def test_stack_dump_on_violation(self, pytester):
+        """Verify thread stacks are logged when a test is interrupted."""
+        pytester.makepyfile("""
+            import pytest
+            import time
+
+            @pytest.mark.vigil(timeout=0.5)
+            def test_slow():
+                time.sleep(2)
+        """)
+        result = pytester.runpytest()
+        full_output = _full_output(result)
+        assert "most recent call first" in full_output
+        assert "in test_slow" in full_output
+        assert result.ret == 1
+
+    def test_stack_dump_disabled_by_env(self, pytester, monkeypatch):
+        """Verify PYTEST_VIGIL__DUMP_STACKS=false skips the stack dump."""
+        monkeypatch.setenv("PYTEST_VIGIL__DUMP_STACKS", "false")
+        pytester.makepyfile("""
+            import pytest
+            import time
+
+            @pytest.mark.vigil(timeout=0.5)
+            def test_slow():
+                time.sleep(2)
+        """)
+        result = pytester.runpytest()
+        full_output = _full_output(result)
         assert "Policy violation" in full_output
+        assert "most recent call first" not in full_output
         assert result.ret == 1
 
 
@@ -924,8 +1083,7 @@ class TestResourceLimitsReports:
         result = pytester.runpytest(f"--vigil-report={report_file}")
         assert result.ret == 0
         
-        with open(pytester.path / report_file) as f:
-            data = json.load(f)
+        data = json.loads((pytester.path / report_file).read_bytes())
         
         assert len(data["results"]) == 1
         assert "test_with_timeout" in data["results"][0]["node_id"]
@@ -949,8 +1107,7 @@ class TestResourceLimitsReports:
         result = pytester.runpytest(f"--vigil-report={report_file}")
         assert result.ret == 0
         
-        with open(pytester.path / report_file) as f:
-            data = json.load(f)
+        data = json.loads((pytester.path / report_file).read_bytes())
         
         assert len(data["results"]) == 1
         limits = data["results"][0]["limits"]
@@ -972,8 +1129,7 @@ class TestResourceLimitsReports:
         result = pytester.runpytest(f"--vigil-report={report_file}")
         assert result.ret == 0
         
-        with open(pytester.path / report_file) as f:
-            data = json.load(f)
+        data = json.loads((pytester.path / report_file).read_bytes())
         
         assert len(data["results"]) == 1
         limits = data["results"][0]["limits"]
@@ -996,8 +1152,7 @@ class TestResourceLimitsReports:
         result = pytester.runpytest(f"--vigil-report={report_file}")
         assert result.ret == 0
         
-        with open(pytester.path / report_file) as f:
-            data = json.load(f)
+        data = json.loads((pytester.path / report_file).read_bytes())
         
         assert len(data["results"]) == 1
         limits = data["results"][0]["limits"]
@@ -1020,8 +1175,7 @@ class TestResourceLimitsReports:
         result = pytester.runpytest(f"--vigil-report={report_file}")
         assert result.ret == 1
         
-        with open(pytester.path / report_file) as f:
-            data = json.load(f)
+        data = json.loads((pytester.path / report_file).read_bytes())
         
         assert len(data["results"]) == 1
         # Check that violation information is captured
@@ -1040,8 +1194,7 @@ class TestResourceLimitsReports:
         result = pytester.runpytest(f"--vigil-report={report_file}", "--vigil-timeout=2.0")
         assert result.ret == 0
         
-        with open(pytester.path / report_file) as f:
-            data = json.load(f)
+        data = json.loads((pytester.path / report_file).read_bytes())
         
         assert len(data["results"]) == 1
         limits = data["results"][0]["limits"]
@@ -1069,8 +1222,7 @@ class TestResourceLimitsReports:
         result = pytester.runpytest(f"--vigil-report={report_file}", "-n", "2")
         assert result.ret == 0
         
-        with open(pytester.path / report_file) as f:
-            data = json.load(f)
+        data = json.loads((pytester.path / report_file).read_bytes())
         
         # Should have all 3 tests in report
         assert len(data["results"]) == 3
@@ -685,6 +685,30 @@ class TestRetryEdgeCases:
         assert result.ret == 0
         result.stdout.fnmatch_lines(["*Detected Flaky Tests*"])
 
+    def test_retry_skips_setup_errors(self, pytester):
+        """Verify a failing fixture is reported as an error without retrying."""
+        pytester.makepyfile("""
+            import pytest
+
+            CALLS = []
+
+            @pytest.fixture
+            def broken():
+                CALLS.append(1)
+                raise RuntimeError("fixture failure")
+
+            @pytest.mark.vigil(retry=2)
+            def test_setup_error(broken):
+                pass
+
+            def test_fixture_called_once():
+                assert len(CALLS) == 1
+        """)
+
+        result = pytester.runpytest()
+        result.assert_outcomes(passed=1, errors=1)
+        assert "Retrying" not in result.stdout.str() + result.stderr.str()
+
 
 # =============================================================================
 # 8. NON-INTERFERENCE
@@ -383,12 +383,11 @@ def test_session_timeout_with_report_generation(pytester):
     # Check if report was created
     import json
     assert report_file.exists()
-    with open(report_file) as f:
-        data = json.load(f)
-        # Report should have some structure
-        assert "timestamp" in data
-        assert "results" in data
-        assert len(data["results"]) == 3  # One result per test
+    data = json.loads(report_file.read_bytes())
+    # Report should have some structure
+    assert "timestamp" in data
+    assert "results" in data
+    assert len(data["results"]) == 3  # One result per test
 
 
 def test_session_timeout_multiple_runs(pytester):